@@ -1,25 +1,24 @@
 # debug_database.py
-from src.database.db_manager import DatabaseManager
+from src.database.db_manager import get_db
 
 # Connect to the database
-db_manager = DatabaseManager()
+db_manager = get_db()
 
-# Get all chemicals
-chemicals = db_manager.get_all_chemicals()
-print(f"Found {len(chemicals)} chemicals in database")
+# Stream only the columns we inspect rather than whole chemicals
+print(f"Found {db_manager.count_chemicals()} chemicals in database")
 
-for chemical in chemicals:
-    print(f"Chemical: {chemical.get('name', 'Unknown')}")
-    print(f"Fields: {sorted(chemical.keys())}")
-    
-    # Check specifically for any field that might contain toxicity data
-    toxicity_related_fields = [
-        'acute_toxicity_notes', 'toxicity_notes', 'toxicity_data', 
-        'ld50', 'lc50', 'acute_toxicity', 'toxicity'
-    ]
-    
-    for field in toxicity_related_fields:
-        if field in chemical and chemical[field]:
-            print(f"Found data in field '{field}': {chemical[field][:100]}...")
+for name, acute_toxicity_notes, ld50, lc50 in db_manager.iter_toxicity_rows():
+    print(f"Chemical: {name or 'Unknown'}")
+
+    # Check the fields that can contain toxicity data
+    toxicity_fields = {
+        'acute_toxicity_notes': acute_toxicity_notes,
+        'ld50': ld50,
+        'lc50': lc50,
+    }
+
+    for field, value in toxicity_fields.items():
+        if value:
+            print(f"Found data in field '{field}': {value[:100]}...")
     
-    print("-" * 50)
\ No newline at end of file
+    print("-" * 50)
@@ -5,7 +5,6 @@ This script demonstrates how to use the PubChemScraper and DatabaseManager
 to search for chemicals, retrieve their data, and store them in a database.
 """
 import logging
-import time
 
 from src.database.db_manager import DatabaseManager
 from src.scrapers.pubchem_scraper import PubChemScraper
@@ -39,7 +38,8 @@ def main():
         "formaldehyde",
     ]
     
-    # Search for and store each chemical
+    # Search for each chemical, collecting the extracted data
+    extracted = []
     with PubChemScraper() as scraper:
         for chem in chemicals:
             logger.info(f"Searching for: {chem}")
@@ -59,14 +59,17 @@ def main():
             chemical_data = scraper.extract_chemical_data(result)
             
             if chemical_data:
-                # Add to database
-                chem_id = db_manager.add_chemical(chemical_data)
-                logger.info(f"Stored chemical with ID: {chem_id}")
+                # Queue for a single bulk write once scraping is done
+                extracted.append(chemical_data)
             else:
                 logger.warning(f"Failed to extract data for: {result['name']}")
-            
-            # Be nice to the API
-            time.sleep(1)
+    
+    # Store everything in one transaction
+    stored_ids = db_manager.add_chemicals_bulk(extracted)
+    if stored_ids is None:
+        logger.error("Failed to store the extracted chemicals")
+    else:
+        logger.info(f"Stored {len(stored_ids)} chemicals")
     
     # Print database summary
     count = db_manager.count_chemicals()
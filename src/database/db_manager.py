@@ -2,16 +2,43 @@
 Database management module for storing and retrieving chemical data.
 """
 
+import csv
+import functools
+import itertools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-
-import pandas as pd
-from sqlalchemy import Column, Float, Integer, String, Text, create_engine, select
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from sqlalchemy import (
+    Column,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+    bindparam,
+    create_engine,
+    delete,
+    event,
+    func,
+    or_,
+    select,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
 
+try:
+    # Optional: pyarrow formats CSV in native code, much faster than csv
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,11 +51,52 @@ logger = logging.getLogger(__name__)
 # Create base class for SQLAlchemy models
 Base = declarative_base()
 
+# Full-text index over the searchable chemical columns. The trigram tokenizer
+# keeps the substring semantics of the old LIKE '%query%' search while letting
+# SQLite answer it from an inverted index instead of scanning every row.
+FTS_TABLE_SQL = """
+CREATE VIRTUAL TABLE chemicals_fts USING fts5(
+    name, cas_number, formula,
+    content='chemicals', content_rowid='id', tokenize='trigram'
+)
+"""
+
+# Triggers mirroring writes on the chemicals table into the full-text index
+FTS_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS chemicals_fts_ai AFTER INSERT ON chemicals BEGIN
+        INSERT INTO chemicals_fts(rowid, name, cas_number, formula)
+        VALUES (new.id, new.name, new.cas_number, new.formula);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chemicals_fts_ad AFTER DELETE ON chemicals BEGIN
+        INSERT INTO chemicals_fts(chemicals_fts, rowid, name, cas_number, formula)
+        VALUES ('delete', old.id, old.name, old.cas_number, old.formula);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chemicals_fts_au AFTER UPDATE ON chemicals BEGIN
+        INSERT INTO chemicals_fts(chemicals_fts, rowid, name, cas_number, formula)
+        VALUES ('delete', old.id, old.name, old.cas_number, old.formula);
+        INSERT INTO chemicals_fts(rowid, name, cas_number, formula)
+        VALUES (new.id, new.name, new.cas_number, new.formula);
+    END
+    """,
+)
+
+# Trigram tokens are three characters long, so shorter queries can't use the index
+FTS_MIN_QUERY_LENGTH = 3
+
 
 class Chemical(Base):
     """SQLAlchemy model for the chemicals table."""
 
     __tablename__ = "chemicals"
+    __table_args__ = (
+        # Serves the name + formula duplicate check in add_chemical
+        Index("ix_chem_name_formula", "name", "formula"),
+    )
 
     # Ensure a primary key is defined
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -86,64 +154,75 @@ class Chemical(Base):
 
     def to_dict(self) -> Dict[str, any]:
         """Convert the model to a dictionary."""
-        base_dict = {
-            "id": self.id,
-            "cas_number": self.cas_number,
-            "name": self.name,
-            "formula": self.formula,
-            "molecular_weight": self.molecular_weight,
-            "canonical_smiles": self.canonical_smiles,
-            "isomeric_smiles": self.isomeric_smiles,
-            "inchi": self.inchi,
-            "inchikey": self.inchikey,
-            "xlogp": self.xlogp,
-            "exact_mass": self.exact_mass,
-            "monoisotopic_mass": self.monoisotopic_mass,
-            "tpsa": self.tpsa,
-            "complexity": self.complexity,
-            "charge": self.charge,
-            "h_bond_donor_count": self.h_bond_donor_count,
-            "h_bond_acceptor_count": self.h_bond_acceptor_count,
-            "rotatable_bond_count": self.rotatable_bond_count,
-            "heavy_atom_count": self.heavy_atom_count,
-            "physical_state": self.physical_state,
-            "color": self.color,
-            "density": self.density,
-            "melting_point": self.melting_point,
-            "boiling_point": self.boiling_point,
-            "flash_point": self.flash_point,
-            "solubility": self.solubility,
-            "vapor_pressure": self.vapor_pressure,
-            "hazard_statements": self.hazard_statements,
-            "precautionary_statements": self.precautionary_statements,
-            "ghs_pictograms": self.ghs_pictograms,
-            "signal_word": self.signal_word,
-            "source_url": self.source_url,
-            "source_name": self.source_name,
-            # Add the toxicity fields
-            "ld50": self.ld50,
-            "lc50": self.lc50,
-            "acute_toxicity_notes": self.acute_toxicity_notes,
+        state = self.__dict__
+        # Read loaded values straight from the instance state; anything not
+        # loaded (e.g. expired after a commit) goes through normal access
+        return {
+            key: state[key] if key in state else getattr(self, key)
+            for key in _CHEM_COLS
         }
 
-        # Add new parsed value columns to the dictionary
-        additional_fields = [
-            "density_value",
-            "density_unit",
-            "melting_point_value",
-            "melting_point_unit",
-            "boiling_point_value",
-            "boiling_point_unit",
-            "flash_point_value",
-            "flash_point_unit",
-            "vapor_pressure_value",
-            "vapor_pressure_unit",
-        ]
 
-        for field in additional_fields:
-            base_dict[field] = getattr(self, field, None)
+# Column names of the chemicals table, in table order
+_CHEM_COLS = tuple(c.name for c in Chemical.__table__.columns)
+_CHEM_COL_SET = frozenset(_CHEM_COLS)
+
+
+def _arrow_type(column_type):
+    """Map a SQLAlchemy column type to the matching pyarrow type."""
+    if isinstance(column_type, Integer):
+        return pa.int64()
+    if isinstance(column_type, Float):
+        return pa.float64()
+    return pa.string()
+
 
-        return base_dict
+def _write_csv_batches(output_path: str, batches: Iterable[List[tuple]]) -> int:
+    """
+    Write batches of chemical rows to a CSV file.
+
+    Uses pyarrow's CSV writer when it is installed, falling back to the
+    standard library csv module otherwise. With pyarrow, each batch is
+    formatted and written on a worker thread while the next batch is read.
+
+    Args:
+        output_path: Path of the CSV file to write
+        batches: Iterable of lists of row tuples ordered as _CHEM_COLS
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    if pa is not None:
+        schema = pa.schema(
+            [
+                (column.name, _arrow_type(column.type))
+                for column in Chemical.__table__.columns
+            ]
+        )
+        pool = ThreadPoolExecutor(max_workers=1)
+        with pool, pa_csv.CSVWriter(output_path, schema) as writer:
+            pending = None
+            for batch in batches:
+                columns = list(zip(*batch))
+                table = pa.Table.from_arrays(columns, schema=schema)
+                # pyarrow formats in native code without holding the GIL, so
+                # writing one batch overlaps with fetching the next
+                if pending is not None:
+                    pending.result()
+                pending = pool.submit(writer.write_table, table)
+                count += len(batch)
+            if pending is not None:
+                pending.result()
+    else:
+        # A large write buffer turns many small row writes into few syscalls
+        with open(output_path, "w", newline="", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(_CHEM_COLS)
+            for batch in batches:
+                writer.writerows(batch)
+                count += len(batch)
+    return count
 
 
 class DatabaseManager:
@@ -160,20 +239,69 @@ class DatabaseManager:
                      will be used in the data directory.
         """
         if db_path is None:
-            # Get the project root directory (assuming this file is in src/database/)
-            project_root = Path(__file__).parent.parent.parent
-            data_dir = project_root / "data"
-            os.makedirs(data_dir, exist_ok=True)
-            db_path = str(data_dir / "chemical_safety.db")
+            db_path = _default_db_path()
 
         # Create the SQLite engine
         self.engine = create_engine(f"sqlite:///{db_path}")
 
-        # Create tables if they don't exist
+        # Use write-ahead logging so commits don't fsync the main database
+        # file each time and readers aren't blocked by writers
+        @event.listens_for(self.engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.close()
+
+        # Create tables if they don't exist. get_db() shares one manager per
+        # database, so this normally runs once per database per process
         Base.metadata.create_all(self.engine)
 
+        # create_all skips indexes on tables that already exist, so make sure
+        # indexes added since the database was created are present too
+        for index in Chemical.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
+        # Set up the full-text search index
+        self.fts_enabled = self._init_fulltext_search()
+
+        # CAS lookups are memoized per manager and cleared on every write
+        self._cas_cache = functools.lru_cache(maxsize=2048)(
+            self._get_chemical_by_cas_uncached
+        )
+
         logger.info(f"Database initialized at {db_path}")
 
+    def _init_fulltext_search(self) -> bool:
+        """
+        Create the FTS5 index and its sync triggers if they don't exist.
+
+        Returns:
+            True if full-text search is available, False if SQLite was built
+            without FTS5 (or the trigram tokenizer) and LIKE search must be used
+        """
+        try:
+            with self.engine.begin() as conn:
+                exists = conn.exec_driver_sql(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'chemicals_fts'"
+                ).first()
+
+                if not exists:
+                    conn.exec_driver_sql(FTS_TABLE_SQL)
+                    # Index any rows that were stored before the index existed
+                    conn.exec_driver_sql(
+                        "INSERT INTO chemicals_fts(chemicals_fts) VALUES ('rebuild')"
+                    )
+
+                for trigger_sql in FTS_TRIGGERS_SQL:
+                    conn.exec_driver_sql(trigger_sql)
+            return True
+        except Exception as e:
+            logger.warning(f"Full-text search unavailable, using LIKE search: {str(e)}")
+            return False
+
     def add_chemical(self, chemical_data: Dict[str, any]) -> Optional[int]:
         """
         Add a chemical to the database.
@@ -186,47 +314,63 @@ class DatabaseManager:
         """
         try:
             with Session(self.engine) as session:
-                # Check if chemical with the same CAS number already exists
-                cas_number = chemical_data.get("cas_number")
-                if cas_number:
-                    existing = session.execute(
-                        select(Chemical).where(Chemical.cas_number == cas_number)
-                    ).scalar_one_or_none()
+                # Only table columns can be written
+                values = {k: v for k, v in chemical_data.items() if k in _CHEM_COL_SET}
 
-                    if existing:
-                        logger.info(
-                            f"Chemical with CAS {cas_number} already exists, updating"
-                        )
-                        # Update the existing record
-                        for key, value in chemical_data.items():
-                            if hasattr(existing, key):
-                                setattr(existing, key, value)
-                        session.commit()
-                        return existing.id
+                cas_number = values.get("cas_number")
+                name = values.get("name")
+                formula = values.get("formula")
 
-                # If no CAS number or chemical not found by CAS, check by name and formula
-                name = chemical_data.get("name")
-                formula = chemical_data.get("formula")
+                # A chemical stored without this CAS number is matched on name
+                # and formula, unless another row already has the CAS number
                 if name and formula:
-                    existing = session.execute(
-                        select(Chemical).where(
-                            (Chemical.name == name) & (Chemical.formula == formula)
+                    stmt = select(Chemical).where(
+                        (Chemical.name == name) & (Chemical.formula == formula)
+                    )
+                    if cas_number:
+                        stmt = stmt.where(
+                            Chemical.cas_number.is_distinct_from(cas_number)
                         )
-                    ).scalar_one_or_none()
+                    existing = session.execute(stmt).scalars().first()
+
+                    if existing and cas_number:
+                        cas_stored = session.execute(
+                            select(Chemical.id).where(Chemical.cas_number == cas_number)
+                        ).first()
+                        if cas_stored:
+                            existing = None
 
                     if existing:
                         logger.info(
                             f"Chemical with name '{name}' and formula '{formula}' already exists, updating"
                         )
-                        # Update the existing record
-                        for key, value in chemical_data.items():
-                            if hasattr(existing, key):
-                                setattr(existing, key, value)
+                        # Update the existing record (values holds only columns)
+                        for key, value in values.items():
+                            setattr(existing, key, value)
                         session.commit()
                         return existing.id
 
+                if cas_number:
+                    # Insert, or update the row with the same CAS number, in a
+                    # single statement that also returns the row ID
+                    values.pop("id", None)
+                    stmt = sqlite_insert(Chemical).values(**values)
+                    update_columns = {
+                        k: stmt.excluded[k] for k in values if k != "cas_number"
+                    } or {"cas_number": stmt.excluded.cas_number}
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=["cas_number"], set_=update_columns
+                    ).returning(Chemical.id)
+
+                    chem_id = session.execute(stmt).scalar_one()
+                    session.commit()
+                    logger.info(
+                        f"Stored chemical: {values.get('name')} (CAS: {cas_number})"
+                    )
+                    return chem_id
+
                 # Create a new chemical record
-                chemical = Chemical(**chemical_data)
+                chemical = Chemical(**values)
                 session.add(chemical)
                 session.commit()
                 logger.info(
@@ -236,6 +380,246 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error adding chemical to database: {str(e)}")
             return None
+        finally:
+            self._cas_cache.cache_clear()
+
+    def add_chemicals_bulk(
+        self,
+        chemicals: List[Dict[str, any]],
+        chunk_size: int = 1000,
+        on_conflict: str = "update",
+    ) -> Optional[List[int]]:
+        """
+        Add many chemicals to the database in a single transaction.
+
+        Chemicals whose CAS number is already stored are updated or skipped,
+        as are chemicals matching a stored row on name and formula (see
+        _match_by_name_and_formula). All others are inserted. Entries sharing
+        a CAS number, or lacking one but sharing a name and formula, are
+        merged, later ones taking precedence.
+
+        Args:
+            chemicals: List of dictionaries containing chemical data
+            chunk_size: Number of rows to write per bulk statement
+            on_conflict: What to do with chemicals that are already stored,
+                either "update" or "skip"
+
+        Returns:
+            IDs of the chemicals written (empty if every chemical was skipped),
+            or None if the batch failed
+        """
+        # Drop keys that aren't table columns and merge duplicate chemicals
+        rows = {}
+        for position, chemical_data in enumerate(chemicals):
+            row = {k: v for k, v in chemical_data.items() if k in _CHEM_COL_SET}
+            if row.get("cas_number"):
+                # Rows with a CAS number are matched on it, not on their ID
+                row.pop("id", None)
+                key = row["cas_number"]
+            elif row.get("name") and row.get("formula") and "id" not in row:
+                key = (row["name"], row["formula"])
+            else:
+                key = position
+            rows.setdefault(key, {}).update(row)
+
+        table = Chemical.__table__
+        ids = []
+        try:
+            # Core statements skip the ORM identity map and unit of work
+            with self.engine.begin() as conn:
+                stored_ids = self._match_by_name_and_formula(conn, rows, chunk_size)
+
+                # executemany needs the same columns in every row, so group by
+                # key set, keeping the matched rows apart as updates
+                groups = {}
+                updates = {}
+                for key, row in rows.items():
+                    if key in stored_ids:
+                        if on_conflict != "skip":
+                            row["_id"] = stored_ids[key]
+                            updates.setdefault(tuple(sorted(row)), []).append(row)
+                    else:
+                        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+                # The SET clause is taken from the keys of the rows
+                stmt = table.update().where(table.c.id == bindparam("_id"))
+                for group in updates.values():
+                    conn.execute(stmt, group)
+                    ids.extend(row["_id"] for row in group)
+
+                for columns, group in groups.items():
+                    # RETURNING hands back the IDs without re-querying by CAS
+                    stmt = sqlite_insert(table).returning(table.c.id)
+                    update_columns = {
+                        c: stmt.excluded[c]
+                        for c in columns
+                        if c not in ("id", "cas_number")
+                    }
+                    if update_columns and on_conflict != "skip":
+                        stmt = stmt.on_conflict_do_update(
+                            index_elements=["cas_number"], set_=update_columns
+                        )
+                    else:
+                        stmt = stmt.on_conflict_do_nothing(
+                            index_elements=["cas_number"]
+                        )
+
+                    for start in range(0, len(group), chunk_size):
+                        result = conn.execute(stmt, group[start : start + chunk_size])
+                        ids.extend(result.scalars())
+
+            logger.info(f"Stored {len(ids)} chemicals in bulk")
+            return ids
+        except Exception as e:
+            logger.error(f"Error adding chemicals to database in bulk: {str(e)}")
+            return None
+        finally:
+            self._cas_cache.cache_clear()
+
+    @staticmethod
+    def _match_by_name_and_formula(
+        conn, rows: Dict[any, Dict[str, any]], chunk_size: int
+    ) -> Dict[any, int]:
+        """
+        Find the stored chemicals that bulk rows match on name and formula.
+
+        A NULL CAS number never conflicts, so chemicals without one are
+        matched to any stored row with the same name and formula. Chemicals
+        with a CAS number are matched to a stored row without one, unless
+        their CAS number is already stored, as in add_chemical().
+
+        Args:
+            conn: Connection of the bulk add's transaction
+            rows: Rows to write, by their merge key
+            chunk_size: Number of keys to look up per query
+
+        Returns:
+            Dictionary mapping row keys to the IDs of the matching stored rows
+        """
+        table = Chemical.__table__
+        pairs = {}
+        for key, row in rows.items():
+            if row.get("name") and row.get("formula") and not isinstance(key, int):
+                pairs.setdefault((row["name"], row["formula"]), []).append(key)
+        if not pairs:
+            return {}
+
+        any_ids = {}
+        cas_less_ids = {}
+        pair_list = list(pairs)
+        for start in range(0, len(pair_list), chunk_size):
+            result = conn.execute(
+                select(table.c.name, table.c.formula, table.c.id, table.c.cas_number)
+                .where(
+                    tuple_(table.c.name, table.c.formula).in_(
+                        pair_list[start : start + chunk_size]
+                    )
+                )
+                .order_by(table.c.id)
+            )
+            for name, formula, chem_id, cas_number in result:
+                any_ids.setdefault((name, formula), chem_id)
+                if not cas_number:
+                    cas_less_ids.setdefault((name, formula), chem_id)
+
+        # Chemicals whose CAS number is stored go to the CAS upsert instead
+        cas_numbers = [
+            key
+            for pair, keys in pairs.items()
+            if pair in cas_less_ids
+            for key in keys
+            if isinstance(key, str)
+        ]
+        stored_cas = set()
+        for start in range(0, len(cas_numbers), chunk_size):
+            stored_cas.update(
+                conn.execute(
+                    select(table.c.cas_number).where(
+                        table.c.cas_number.in_(cas_numbers[start : start + chunk_size])
+                    )
+                ).scalars()
+            )
+
+        # Each stored row is matched by at most one chemical
+        matched = {}
+        claimed = set()
+        for pair, keys in pairs.items():
+            for key in keys:
+                if isinstance(key, tuple):
+                    chem_id = any_ids.get(pair)
+                elif key not in stored_cas:
+                    chem_id = cas_less_ids.get(pair)
+                else:
+                    chem_id = None
+                if chem_id is not None and chem_id not in claimed:
+                    claimed.add(chem_id)
+                    matched[key] = chem_id
+        return matched
+
+    def delete_chemical(self, chemical_id: int) -> bool:
+        """
+        Delete a chemical by its ID.
+
+        Args:
+            chemical_id: ID of the chemical to delete
+
+        Returns:
+            True if the chemical was deleted, False otherwise
+        """
+        try:
+            with self.engine.begin() as conn:
+                result = conn.execute(
+                    delete(Chemical.__table__).where(
+                        Chemical.__table__.c.id == chemical_id
+                    )
+                )
+            return result.rowcount > 0
+        except Exception as e:
+            logger.error(f"Error deleting chemical with ID {chemical_id}: {str(e)}")
+            return False
+        finally:
+            self._cas_cache.cache_clear()
+
+    def delete_by_identifier(self, identifier: str) -> List[Dict[str, any]]:
+        """
+        Delete the chemical with exactly this CAS number or name.
+
+        Finding and deleting take a single statement. Names are compared
+        case-insensitively. If several chemicals match, none are deleted.
+
+        Args:
+            identifier: CAS number or name of the chemical
+
+        Returns:
+            ID, name and CAS number of each matching chemical, which were only
+            deleted if there is exactly one. Empty if none matched or the
+            deletion failed
+        """
+        table = Chemical.__table__
+        stmt = (
+            delete(table)
+            .where(
+                or_(
+                    table.c.cas_number == identifier,
+                    func.lower(table.c.name) == identifier.lower(),
+                )
+            )
+            .returning(table.c.id, table.c.name, table.c.cas_number)
+        )
+
+        try:
+            with self.engine.connect() as conn:
+                with conn.begin() as transaction:
+                    matches = [dict(row._mapping) for row in conn.execute(stmt)]
+                    if len(matches) > 1:
+                        # Ambiguous, so leave it to the caller to pick one
+                        transaction.rollback()
+            return matches
+        except Exception as e:
+            logger.error(f"Error deleting chemical '{identifier}': {str(e)}")
+            return []
+        finally:
+            self._cas_cache.cache_clear()
 
     def get_chemical_by_cas(self, cas_number: str) -> Optional[Dict[str, any]]:
         """
@@ -248,24 +632,45 @@ class DatabaseManager:
             Dictionary containing chemical data, or None if not found
         """
         try:
-            with Session(self.engine) as session:
-                chemical = session.execute(
-                    select(Chemical).where(Chemical.cas_number == cas_number)
-                ).scalar_one_or_none()
-
-                if chemical:
-                    return chemical.to_dict()
-                return None
+            chemical = self._cas_cache(cas_number)
         except Exception as e:
             logger.error(f"Error retrieving chemical with CAS {cas_number}: {str(e)}")
             return None
 
-    def search_chemicals(self, query: str) -> List[Dict[str, any]]:
+        # Hand out a copy so callers can't modify the cached entry
+        return dict(chemical) if chemical else None
+
+    def _get_chemical_by_cas_uncached(
+        self, cas_number: str
+    ) -> Optional[Dict[str, any]]:
+        """
+        Look up a chemical by its CAS number in the database.
+
+        Args:
+            cas_number: CAS registry number
+
+        Returns:
+            Dictionary containing chemical data, or None if not found
+        """
+        with Session(self.engine) as session:
+            chemical = session.execute(
+                select(Chemical).where(Chemical.cas_number == cas_number)
+            ).scalar_one_or_none()
+
+            if chemical:
+                return chemical.to_dict()
+            return None
+
+    def search_chemicals(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Dict[str, any]]:
         """
         Search for chemicals by name or CAS number.
 
         Args:
             query: Search query (partial name or CAS number)
+            limit: Maximum number of matches to return. The database stops
+                   scanning once this many are found (default: no limit)
 
         Returns:
             List of dictionaries containing matching chemical data
@@ -275,37 +680,29 @@ class DatabaseManager:
                 # Print out the full query for debugging
                 logger.info(f"Searching for chemical query: {query}")
 
-                # Search by name (case-insensitive LIKE query)
-                name_matches = (
-                    session.execute(
-                        select(Chemical).where(Chemical.name.ilike(f"%{query}%"))
-                    )
-                    .scalars()
-                    .all()
-                )
-
-                # Search by CAS number (case-insensitive LIKE query)
-                cas_matches = (
-                    session.execute(
-                        select(Chemical).where(Chemical.cas_number.ilike(f"%{query}%"))
+                if self.fts_enabled and len(query) >= FTS_MIN_QUERY_LENGTH:
+                    # Look up matching row IDs in the full-text index, quoting
+                    # the query so it is matched as a literal substring
+                    fts_query = '"' + query.replace('"', '""') + '"'
+                    matching_ids = text(
+                        "SELECT rowid FROM chemicals_fts WHERE chemicals_fts MATCH :q"
+                    ).bindparams(q=fts_query)
+                    condition = Chemical.id.in_(
+                        matching_ids.columns(Chemical.id).scalar_subquery()
                     )
-                    .scalars()
-                    .all()
-                )
-
-                # Search by formula (case-sensitive)
-                formula_matches = (
-                    session.execute(
-                        select(Chemical).where(Chemical.formula.like(f"%{query}%"))
+                else:
+                    # Match name, CAS number, or formula in a single table scan
+                    pattern = f"%{query}%"
+                    condition = or_(
+                        Chemical.name.ilike(pattern),
+                        Chemical.cas_number.ilike(pattern),
+                        Chemical.formula.like(pattern),
                     )
-                    .scalars()
-                    .all()
-                )
 
-                # Combine results, removing duplicates
-                all_matches = {
-                    c.id: c for c in name_matches + cas_matches + formula_matches
-                }
+                stmt = select(Chemical).where(condition)
+                if limit is not None:
+                    stmt = stmt.limit(limit)
+                all_matches = session.execute(stmt).scalars().all()
 
                 # Log the number of matches found
                 logger.info(f"Found {len(all_matches)} matching chemicals")
@@ -316,11 +713,51 @@ class DatabaseManager:
                         f"No matches found for queries: name like '%{query}%', cas_number like '%{query}%', formula like '%{query}%'"
                     )
 
-                return [c.to_dict() for c in all_matches.values()]
+                return [c.to_dict() for c in all_matches]
         except Exception as e:
             logger.error(f"Error searching chemicals with query '{query}': {str(e)}")
             return []
 
+    def search_chemicals_bulk(self, identifiers: Iterable[str]) -> Set[str]:
+        """
+        Find which of several names or CAS numbers are already stored.
+
+        Names are compared case-insensitively and must match exactly.
+
+        Args:
+            identifiers: Chemical names or CAS numbers
+
+        Returns:
+            Lowercased names and CAS numbers from the input that are in the
+            database
+        """
+        identifiers = list(identifiers)
+        lowered = {identifier.lower() for identifier in identifiers}
+        if not lowered:
+            return set()
+
+        try:
+            with Session(self.engine) as session:
+                lower_name = func.lower(Chemical.name)
+                rows = session.execute(
+                    select(lower_name, Chemical.cas_number).where(
+                        or_(
+                            lower_name.in_(lowered),
+                            Chemical.cas_number.in_(identifiers),
+                        )
+                    )
+                ).all()
+
+            found = set()
+            for name, cas_number in rows:
+                found.add(name)
+                if cas_number:
+                    found.add(cas_number.lower())
+            return found & lowered
+        except Exception as e:
+            logger.error(f"Error searching chemicals in bulk: {str(e)}")
+            return set()
+
     def export_to_csv(self, output_path: Optional[str] = None) -> Optional[str]:
         """
         Export the chemicals database to a CSV file.
@@ -332,32 +769,36 @@ class DatabaseManager:
         Returns:
             Path to the saved CSV file, or None if export failed
         """
+        raw = self.engine.raw_connection()
         try:
-            with Session(self.engine) as session:
-                chemicals = session.execute(select(Chemical)).scalars().all()
-
-                if not chemicals:
-                    logger.warning("No chemicals to export")
-                    return None
-
-                # Convert to dataframe
-                data = [c.to_dict() for c in chemicals]
-                df = pd.DataFrame(data)
-
-                # Set default output path if not provided
-                if output_path is None:
-                    project_root = Path(__file__).parent.parent.parent
-                    data_dir = project_root / "data" / "processed"
-                    os.makedirs(data_dir, exist_ok=True)
-                    output_path = str(data_dir / "chemicals_export.csv")
-
-                # Save to CSV
-                df.to_csv(output_path, index=False)
-                logger.info(f"Exported {len(data)} chemicals to {output_path}")
-                return output_path
+            # Read rows straight from the DBAPI cursor; building Chemical
+            # objects only to turn them back into text is wasted work
+            cursor = raw.cursor()
+            cursor.arraysize = 10000
+            cursor.execute(f"SELECT {', '.join(_CHEM_COLS)} FROM chemicals")
+
+            first_batch = cursor.fetchmany()
+            if not first_batch:
+                logger.warning("No chemicals to export")
+                return None
+
+            # Set default output path if not provided
+            if output_path is None:
+                project_root = Path(__file__).parent.parent.parent
+                data_dir = project_root / "data" / "processed"
+                os.makedirs(data_dir, exist_ok=True)
+                output_path = str(data_dir / "chemicals_export.csv")
+
+            batches = itertools.chain([first_batch], iter(cursor.fetchmany, []))
+            count = _write_csv_batches(output_path, batches)
+
+            logger.info(f"Exported {count} chemicals to {output_path}")
+            return output_path
         except Exception as e:
             logger.error(f"Error exporting chemicals to CSV: {str(e)}")
             return None
+        finally:
+            raw.close()
 
     def get_all_chemicals(self) -> List[Dict[str, any]]:
         """
@@ -366,13 +807,51 @@ class DatabaseManager:
         Returns:
             List of dictionaries containing all chemical data
         """
+        return list(self.iter_chemicals())
+
+    def iter_chemicals(self, batch_size: int = 1000) -> Iterator[Dict[str, any]]:
+        """
+        Iterate over all chemicals in the database without loading them all.
+
+        Rows are fetched from the database in batches as the iterator is
+        consumed.
+
+        Args:
+            batch_size: Number of rows to fetch from the database at a time
+
+        Yields:
+            Dictionaries containing chemical data
+        """
         try:
             with Session(self.engine) as session:
-                chemicals = session.execute(select(Chemical)).scalars().all()
-                return [c.to_dict() for c in chemicals]
+                stmt = select(Chemical).execution_options(yield_per=batch_size)
+                for chemical in session.execute(stmt).scalars():
+                    yield chemical.to_dict()
         except Exception as e:
             logger.error(f"Error retrieving all chemicals: {str(e)}")
-            return []
+
+    def iter_toxicity_rows(self) -> Iterator[tuple]:
+        """
+        Iterate over the name and toxicity fields of every chemical.
+
+        Only the needed columns are selected, so no Chemical objects are
+        built.
+
+        Yields:
+            Tuples of (name, acute_toxicity_notes, ld50, lc50)
+        """
+        try:
+            with Session(self.engine) as session:
+                stmt = select(
+                    Chemical.name,
+                    Chemical.acute_toxicity_notes,
+                    Chemical.ld50,
+                    Chemical.lc50,
+                ).execution_options(yield_per=500)
+                for row in session.execute(stmt):
+                    yield tuple(row)
+        except Exception as e:
+            logger.error(f"Error retrieving toxicity data: {str(e)}")
 
     def count_chemicals(self) -> int:
         """
@@ -383,8 +862,51 @@ class DatabaseManager:
         """
         try:
             with Session(self.engine) as session:
-                count = session.query(Chemical).count()
+                count = session.execute(
+                    select(func.count()).select_from(Chemical)
+                ).scalar_one()
                 return count
         except Exception as e:
             logger.error(f"Error counting chemicals: {str(e)}")
             return 0
+
+
+def _default_db_path() -> str:
+    """
+    Get the path of the default database, creating its directory if needed.
+
+    Returns:
+        Path to the SQLite database file in the data directory
+    """
+    # Get the project root directory (assuming this file is in src/database/)
+    project_root = Path(__file__).parent.parent.parent
+    data_dir = project_root / "data"
+    os.makedirs(data_dir, exist_ok=True)
+    return str(data_dir / "chemical_safety.db")
+
+
+def get_db(db_path: Optional[str] = None) -> DatabaseManager:
+    """
+    Get a shared database manager for the given database file.
+
+    The engine and its connection pool are created on first use and reused
+    by every later call for the same file, however its path is written.
+
+    Args:
+        db_path: Path to the SQLite database file. If None, the default path
+                 in the data directory is used.
+
+    Returns:
+        DatabaseManager instance for the database
+    """
+    if db_path is None:
+        db_path = _default_db_path()
+    if db_path != ":memory:":
+        db_path = os.path.abspath(db_path)
+    return _get_db(db_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_db(db_path: str) -> DatabaseManager:
+    """Create the shared database manager for a normalised path."""
+    return DatabaseManager(db_path)
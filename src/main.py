@@ -6,37 +6,392 @@ retrieving chemical data from PubChem and storing it in a database.
 """
 
 import argparse
+import csv
+import functools
+import io
+import itertools
 import json
 import logging
 import os
 import re
 import sys
-import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from src.database.db_manager import DatabaseManager
-from src.scrapers.pubchem_scraper import PubChemScraper
+from src.utils.helpers import is_valid_cas
+
+# The database and scraper pull in SQLAlchemy and requests, so they are
+# imported inside the commands that use them to keep startup fast
+try:
+    # Optional: RE2 matches the toxicity patterns in linear time
+    import re2 as _toxicity_re
+except ImportError:
+    _toxicity_re = re
+
+try:
+    # Optional: orjson serializes considerably faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from src.database.db_manager import DatabaseManager
+    from src.scrapers.pubchem_scraper import PubChemScraper
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+# Toxicity value formats, each fused into one alternation so the text is
+# scanned once per metric. Matching ignores case, which also lets the unit
+# alternatives collapse. Gaps are bounded and stay within a line so long
+# notes can't cause runaway backtracking. The flag is inline so the
+# patterns compile under RE2 as well as re
+_LD50_PATTERN = _toxicity_re.compile(
+    "(?i)"
+    + "|".join(
+        f"(?:{p})"
+        for p in (
+            r"\bLD50[^\n]{0,120}?\d[\d\.]*\s*m?g/(?:kg|l)[^\n()]{0,80}?\([^)]{1,80}\)",
+            r"\bLD50\s+\w+\s+\w+\s+[\d\.]+\s+(?:g/l|mg/kg)",
+            r"\bLD50:\s*[\d\.]+\s*m?g/(?:kg|l)[^\n()]{0,80}?\([^)]{1,80}\)",
+        )
+    )
+)
+_LC50_PATTERN = _toxicity_re.compile(
+    "(?i)"
+    + "|".join(
+        f"(?:{p})"
+        for p in (
+            r"\bLC50[^\n]{0,120}?\d[\d\.]*\s*(?:ppm|m?g/(?:l|m3))[^\n()]{0,80}?\([^)]{1,80}\)",
+            r"\bLC50\s+\w+\s+\w+\s+[\d\.]+\s+(?:g/cu m|ppm)",
+            r"\bLC50[^\n]{0,120}?\d[\d\.]*\s*(?:ppm|mg/l|g/cu m)",
+        )
+    )
+)
 
-def setup_argparse():
-    """Set up command-line argument parsing."""
-    parser = argparse.ArgumentParser(
-        description="Chemical Safety Database - Search, store, and query chemical data"
+
+def _json_dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string, using orjson when available.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _json_dumpb(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, using orjson when available.
+
+    orjson produces bytes directly, so writing them to a binary file skips
+    decoding and re-encoding every row.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pandas():
+    """
+    Import pandas on first use.
+
+    pandas takes hundreds of milliseconds to import, so only commands that
+    need it pay for it, and only once per process.
+
+    Returns:
+        The pandas module
+    """
+    import pandas
+
+    return pandas
+
+
+def _write_excel(output_path: str, fieldnames: List[str], rows) -> int:
+    """
+    Write rows to an Excel file, streaming them when xlsxwriter is installed.
+
+    Args:
+        output_path: Path to the output file
+        fieldnames: Column names, in order
+        rows: Iterable of dictionaries keyed by column name
+
+    Returns:
+        Number of rows written
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        pd = _get_pandas()
+        logger.warning("Excel export loads all chemicals into memory")
+        df = pd.DataFrame(list(rows), columns=fieldnames)
+        df.to_excel(output_path, index=False)
+        return len(df)
+
+    # constant_memory flushes each row to disk once the next one starts
+    workbook = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, fieldnames)
+        count = 0
+        for count, row in enumerate(rows, 1):
+            values = [row.get(name) for name in fieldnames]
+            # Cells only hold scalars, so nested data is written as JSON
+            values = [
+                _json_dumps(v) if isinstance(v, (dict, list)) else v for v in values
+            ]
+            worksheet.write_row(count, 0, values)
+    finally:
+        workbook.close()
+    return count
+
+
+# Alternative names for common chemicals
+_CHEMICAL_VARIATIONS: Dict[str, Tuple[str, ...]] = {
+    "water": ("water", "oxidane", "H2O"),
+    "ethanol": ("ethanol", "ethyl alcohol", "C2H6O", "alcohol"),
+    "hydrochloric acid": ("hydrochloric acid", "chlorane", "HCl"),
+    "methanol": ("methanol", "methyl alcohol", "CH3OH", "wood alcohol"),
+    "acetone": ("acetone", "propanone", "dimethyl ketone"),
+    "benzene": ("benzene", "C6H6"),
+}
+
+# Lowercased name -> the other names of that chemical, so a lookup is a
+# single dict probe on the lowercased query
+_VARIATION_INDEX: Dict[str, Tuple[str, ...]] = {
+    variation.lower(): tuple(v for v in variations if v.lower() != variation.lower())
+    for variations in _CHEMICAL_VARIATIONS.values()
+    for variation in variations
+}
+
+
+# Properties shown by 'query', grouped by category for better display
+_DISPLAY_CATEGORIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("Identifiers", ("id", "cas_number", "name", "formula")),
+    (
+        "Physical Properties",
+        (
+            "molecular_weight",
+            "physical_state",
+            "color",
+            "density",
+            "melting_point",
+            "boiling_point",
+            "flash_point",
+            "solubility",
+            "vapor_pressure",
+        ),
+    ),
+    ("Toxicity Data", ("ld50", "lc50")),
+    (
+        "Safety Information",
+        (
+            "hazard_statements",
+            "precautionary_statements",
+            "ghs_pictograms",
+            "signal_word",
+        ),
+    ),
+    (
+        "Chemical Properties",
+        (
+            "xlogp",
+            "exact_mass",
+            "monoisotopic_mass",
+            "tpsa",
+            "complexity",
+            "charge",
+            "h_bond_donor_count",
+            "h_bond_acceptor_count",
+            "rotatable_bond_count",
+            "heavy_atom_count",
+        ),
+    ),
+    ("Source Information", ("source_url", "source_name")),
+    (
+        "Computed Values",
+        (
+            "density_value",
+            "density_unit",
+            "melting_point_value",
+            "melting_point_unit",
+            "boiling_point_value",
+            "boiling_point_unit",
+            "flash_point_value",
+            "flash_point_unit",
+            "vapor_pressure_value",
+            "vapor_pressure_unit",
+        ),
+    ),
+    (
+        "Chemical Identifiers",
+        ("canonical_smiles", "isomeric_smiles", "inchi", "inchikey"),
+    ),
+)
+
+# Display label of each property, e.g. "Cas Number" for "cas_number"
+_DISPLAY_NAMES = {
+    key: key.replace("_", " ").title()
+    for _, props in _DISPLAY_CATEGORIES
+    for key in props
+}
+
+# Only show these categories in verbose mode
+_VERBOSE_CATEGORIES = frozenset(
+    {"Chemical Properties", "Chemical Identifiers", "Computed Values"}
+)
+
+
+# Fields that take the same few values across many chemicals. Interning
+# them lets a batch share one string object per distinct value
+_CATEGORICAL_FIELDS = (
+    "physical_state",
+    "color",
+    "ghs_pictograms",
+    "signal_word",
+    "source_name",
+    "density_unit",
+    "melting_point_unit",
+    "boiling_point_unit",
+    "flash_point_unit",
+    "vapor_pressure_unit",
+)
+
+
+def _intern_fields(chemical_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern the short categorical strings of a chemical in place.
+
+    Args:
+        chemical_data: Dictionary containing chemical data
+
+    Returns:
+        The same dictionary
+    """
+    for key in _CATEGORICAL_FIELDS:
+        value = chemical_data.get(key)
+        if isinstance(value, str) and len(value) < 64:
+            chemical_data[key] = sys.intern(value)
+    return chemical_data
+
+
+# Chemicals fetched concurrently during an import. The scraper spaces out
+# the requests of all workers to stay under PubChem's rate limit
+_IMPORT_WORKERS = 5
+
+# Chemicals per import batch. Each batch is stored in one transaction and
+# its search results' properties are fetched in one request, so larger
+# batches mean fewer commits and requests
+_IMPORT_BATCH_SIZE = 100
+
+# Rows read from the database at a time during an export
+_EXPORT_BATCH_SIZE = 1000
+
+
+# Subcommands and their help text, in the order they are listed
+_COMMAND_HELP = {
+    "search": "Search for a chemical",
+    "query": "Query specific chemical information",
+    "import": "Import chemicals from a file",
+    "export": "Export the database to a file",
+    "count": "Count the number of chemicals in the database",
+    "delete": "Delete a chemical from the database",
+    "update": "Update chemical data in the database",
+    "version": "Show version information",
+}
+
+
+class _FastChoices(tuple):
+    """
+    Tuple of argparse choices with constant-time membership tests.
+    """
+
+    def __new__(cls, choices):
+        self = super().__new__(cls, (sys.intern(choice) for choice in choices))
+        self._members = frozenset(self)
+        return self
+
+    def __contains__(self, item) -> bool:
+        return item in self._members
+
+
+# Properties that can be requested with 'query --property'
+_PROPERTY_CHOICES = _FastChoices(
+    (
+        # Identification properties
+        "cas_number",
+        "name",
+        "formula",
+        "molecular_weight",
+        # Physical properties
+        "flash_point",
+        "boiling_point",
+        "melting_point",
+        "density",
+        "vapor_pressure",
+        "solubility",
+        "physical_state",
+        "color",
+        # Safety properties
+        "hazard_statements",
+        "precautionary_statements",
+        "ghs_pictograms",
+        "signal_word",
+        # Toxicity-related properties
+        "ld50",
+        "lc50",
+        "acute_toxicity_notes",
     )
+)
+_QUERY_FORMATS = _FastChoices(("text", "json", "csv"))
+_EXPORT_FORMATS = _FastChoices(("csv", "json", "excel"))
+
+
+def _sniff_subcommand(argv: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Find the subcommand on the command line without parsing it.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:]
+
+    Returns:
+        The subcommand name, or None if no known subcommand was given
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    for arg in argv:
+        if not arg.startswith("-"):
+            return arg if arg in _COMMAND_HELP else None
+    return None
 
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    # Search command
-    search_parser = subparsers.add_parser("search", help="Search for a chemical")
+def _build_search_parser(subparsers) -> None:
+    """Add the search command and its arguments."""
+    search_parser = subparsers.add_parser("search", help=_COMMAND_HELP["search"])
     search_parser.add_argument(
         "query", help="Chemical name or CAS number to search for"
     )
@@ -46,53 +401,36 @@ def setup_argparse():
     search_parser.add_argument(
         "--limit", type=int, default=5, help="Maximum number of results to display"
     )
-
-    # Query command
-    query_parser = subparsers.add_parser(
-        "query", help="Query specific chemical information"
+    search_parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Fetch fresh data from PubChem instead of using cached responses",
     )
+
+
+def _build_query_parser(subparsers) -> None:
+    """Add the query command and its arguments."""
+    query_parser = subparsers.add_parser("query", help=_COMMAND_HELP["query"])
     query_parser.add_argument("chemical", help="Chemical name or CAS number")
     query_parser.add_argument(
         "--property",
         help="Specific property to retrieve",
-        choices=[
-            # Identification properties
-            "cas_number",
-            "name",
-            "formula",
-            "molecular_weight",
-            # Physical properties
-            "flash_point",
-            "boiling_point",
-            "melting_point",
-            "density",
-            "vapor_pressure",
-            "solubility",
-            "physical_state",
-            "color",
-            # Safety properties
-            "hazard_statements",
-            "precautionary_statements",
-            "ghs_pictograms",
-            "signal_word",
-            # Toxicity-related properties
-            "ld50",
-            "lc50",
-            "acute_toxicity_notes",
-        ],
+        choices=_PROPERTY_CHOICES,
     )
     query_parser.add_argument(
         "--format",
         help="Output format",
-        choices=["text", "json", "csv"],
+        choices=_QUERY_FORMATS,
         default="text",
     )
     query_parser.add_argument(
         "--verbose", "-v", action="store_true", help="Show detailed information"
     )
 
-    # Import command
-    import_parser = subparsers.add_parser("import", help="Import chemicals from a file")
+
+def _build_import_parser(subparsers) -> None:
+    """Add the import command and its arguments."""
+    import_parser = subparsers.add_parser("import", help=_COMMAND_HELP["import"])
     import_parser.add_argument(
         "file",
         help="Path to a file containing chemical names or CAS numbers (one per line)",
@@ -103,58 +441,143 @@ def setup_argparse():
         help="Skip chemicals that already exist in the database",
     )
     import_parser.add_argument(
-        "--update", action="store_true", help="Update existing chemicals with new data"
+        "--update",
+        action="store_true",
+        help="Update existing chemicals with new data (the default unless "
+        "--skip-existing is given)",
     )
     import_parser.add_argument(
         "--batch-size",
         type=int,
-        default=10,
-        help="Number of chemicals to process in a batch",
+        default=_IMPORT_BATCH_SIZE,
+        help="Number of chemicals to process and store in a batch",
     )
-
-    # Export command
-    export_parser = subparsers.add_parser(
-        "export", help="Export the database to a file"
+    import_parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Fetch fresh data from PubChem instead of using cached responses",
+    )
+    import_parser.add_argument(
+        "--workers",
+        type=int,
+        default=_IMPORT_WORKERS,
+        help="Number of chemicals to fetch from PubChem concurrently",
     )
+
+
+def _build_export_parser(subparsers) -> None:
+    """Add the export command and its arguments."""
+    export_parser = subparsers.add_parser("export", help=_COMMAND_HELP["export"])
     export_parser.add_argument("--output", help="Path to the output file")
     export_parser.add_argument(
         "--format",
         help="Output format",
-        choices=["csv", "json", "excel"],
+        choices=_EXPORT_FORMATS,
         default="csv",
     )
     export_parser.add_argument(
         "--filter",
         help="Filter chemical export by property (e.g. 'cas_number=64-17-5' or 'name=ethanol')",
     )
+    export_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_EXPORT_BATCH_SIZE,
+        help="Number of chemicals to read from the database at a time",
+    )
 
-    # Count command
-    subparsers.add_parser("count", help="Count the number of chemicals in the database")
 
-    # Delete command
-    delete_parser = subparsers.add_parser(
-        "delete", help="Delete a chemical from the database"
-    )
+def _build_delete_parser(subparsers) -> None:
+    """Add the delete command and its arguments."""
+    delete_parser = subparsers.add_parser("delete", help=_COMMAND_HELP["delete"])
     delete_parser.add_argument("chemical", help="Chemical name or CAS number to delete")
     delete_parser.add_argument(
         "--force", action="store_true", help="Force deletion without confirmation"
     )
 
-    # Update command
-    update_parser = subparsers.add_parser(
-        "update", help="Update chemical data in the database"
-    )
+
+def _build_update_parser(subparsers) -> None:
+    """Add the update command and its arguments."""
+    update_parser = subparsers.add_parser("update", help=_COMMAND_HELP["update"])
     update_parser.add_argument("chemical", help="Chemical name or CAS number to update")
     update_parser.add_argument(
         "--refresh", action="store_true", help="Fetch fresh data from source"
     )
 
-    # Version command
-    subparsers.add_parser("version", help="Show version information")
+
+# Builders for subcommands that take arguments
+_PARSER_BUILDERS = {
+    "search": _build_search_parser,
+    "query": _build_query_parser,
+    "import": _build_import_parser,
+    "export": _build_export_parser,
+    "delete": _build_delete_parser,
+    "update": _build_update_parser,
+}
+
+
+def setup_argparse(argv: Optional[List[str]] = None):
+    """
+    Set up command-line argument parsing.
+
+    Only the arguments of the subcommand being run are defined; the other
+    subcommands are registered by name so they still appear in the help.
+
+    Args:
+        argv: Command-line arguments, defaults to sys.argv[1:]
+    """
+    return _build_parser(_sniff_subcommand(argv))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Build the argument parser for a subcommand.
+
+    Parsers are cached per subcommand, so calling main() repeatedly in one
+    process only builds each of them once.
+
+    Args:
+        command: Subcommand to define the arguments of, or None for all
+
+    Returns:
+        The argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Chemical Safety Database - Search, store, and query chemical data"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+
+    for name, help_text in _COMMAND_HELP.items():
+        builder = _PARSER_BUILDERS.get(name)
+        if builder is not None and command in (None, name):
+            builder(subparsers)
+        else:
+            subparsers.add_parser(name, help=help_text)
 
     return parser
 
 
+def _extract_values(pattern, text: str) -> Optional[str]:
+    """
+    Join the distinct matches of a toxicity pattern in text.
+
+    Args:
+        pattern: Compiled toxicity pattern
+        text: Text containing toxicity information
+
+    Returns:
+        Matches joined with "; ", or None if none found
+    """
+    # Every format starts with a marker and ends with a unit or a closing
+    # parenthesis, so matches are never empty and need no stripping. The
+    # dict drops duplicates in O(1) while keeping the order they were found in
+    values = dict.fromkeys(match.group(0) for match in pattern.finditer(text))
+
+    return "; ".join(values) if values else None
+
+
 def extract_ld50_values(text: str) -> Optional[str]:
     """
     Extract LD50 values from text.
@@ -165,26 +588,11 @@ def extract_ld50_values(text: str) -> Optional[str]:
     Returns:
         Formatted string with LD50 values or None if none found
     """
-    if not text:
-        return None
-
-    # Find all instances of LD50 with values
-    ld50_pattern = r"LD50.*?(\d+[\d\.]*).*?(mg/kg|g/kg|mg/L|g/L).*?\(([^)]+)\)"
-    alternate_pattern = r"LD50\s+(\w+)\s+(\w+)\s+([\d\.]+)\s+(g/[lL]|mg/kg)"
-    simple_pattern = r"LD50:\s*([\d\.]+)\s*(mg/kg|g/kg|mg/L|g/L).*?\(([^)]+)\)"
-
-    # Extract all primary matches
-    ld50_values = []
-    for pattern in [ld50_pattern, alternate_pattern, simple_pattern]:
-        for match in re.finditer(pattern, text):
-            value = match.group(0).strip()
-            if value and value not in ld50_values:
-                ld50_values.append(value)
-
-    if not ld50_values:
+    # Every format starts with "LD50", so a substring check rules out most
+    # notes without running the regex
+    if not text or "ld50" not in text.lower():
         return None
-
-    return "; ".join(ld50_values)
+    return _extract_values(_LD50_PATTERN, text)
 
 
 def extract_lc50_values(text: str) -> Optional[str]:
@@ -197,28 +605,31 @@ def extract_lc50_values(text: str) -> Optional[str]:
     Returns:
         Formatted string with LC50 values or None if none found
     """
-    if not text:
+    # Every format starts with "LC50", so a substring check rules out most
+    # notes without running the regex
+    if not text or "lc50" not in text.lower():
         return None
+    return _extract_values(_LC50_PATTERN, text)
 
-    # Find all instances of LC50 with values
-    lc50_pattern = (
-        r"LC50.*?(\d+[\d\.]*).*?(ppm|mg/[lL]|g/[lL]|mg/m3|g/m3).*?\(([^)]+)\)"
-    )
-    alternate_pattern = r"LC50\s+(\w+)\s+(\w+)\s+([\d\.]+)\s+(g/cu m|ppm)"
-    simple_pattern = r"LC50.*?(\d+[\d\.]*)\s*(ppm|mg/[lL]|g/cu m)"
-
-    # Extract all primary matches
-    lc50_values = []
-    for pattern in [lc50_pattern, alternate_pattern, simple_pattern]:
-        for match in re.finditer(pattern, text):
-            value = match.group(0).strip()
-            if value and value not in lc50_values:
-                lc50_values.append(value)
-
-    if not lc50_values:
-        return None
 
-    return "; ".join(lc50_values)
+def extract_toxicity(notes: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract both LD50 and LC50 values from toxicity notes.
+
+    Args:
+        notes: Text containing toxicity information
+
+    Returns:
+        Tuple of formatted LD50 and LC50 strings, each None if none found
+    """
+    if not notes:
+        return None, None
+
+    # Lowercase once for both substring checks
+    lowered = notes.lower()
+    ld50 = _extract_values(_LD50_PATTERN, notes) if "ld50" in lowered else None
+    lc50 = _extract_values(_LC50_PATTERN, notes) if "lc50" in lowered else None
+    return ld50, lc50
 
 
 def process_chemical_data(chemical_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -234,29 +645,33 @@ def process_chemical_data(chemical_data: Dict[str, Any]) -> Dict[str, Any]:
     if not chemical_data:
         return {}
 
-    # Extract toxicity data from acute_toxicity_notes if needed
-    if (
-        "acute_toxicity_notes" in chemical_data
-        and chemical_data["acute_toxicity_notes"]
-    ):
-        notes = chemical_data["acute_toxicity_notes"]
-
-        # Extract LD50 if not already set
-        if not chemical_data.get("ld50"):
-            ld50_values = extract_ld50_values(notes)
-            if ld50_values:
-                chemical_data["ld50"] = ld50_values
-
-        # Extract LC50 if not already set
-        if not chemical_data.get("lc50"):
-            lc50_values = extract_lc50_values(notes)
-            if lc50_values:
-                chemical_data["lc50"] = lc50_values
+    ld50 = chemical_data.get("ld50")
+    lc50 = chemical_data.get("lc50")
+
+    # Extract toxicity data from acute_toxicity_notes if needed, only
+    # scanning for the values that aren't already set
+    notes = chemical_data.get("acute_toxicity_notes")
+    if not notes or (ld50 and lc50):
+        return chemical_data
+
+    if not ld50 and not lc50:
+        ld50, lc50 = extract_toxicity(notes)
+    elif not ld50:
+        ld50 = extract_ld50_values(notes)
+    else:
+        lc50 = extract_lc50_values(notes)
+
+    if ld50:
+        chemical_data["ld50"] = ld50
+    if lc50:
+        chemical_data["lc50"] = lc50
 
     return chemical_data
 
 
-def search_chemical(query: str, store: bool = False, limit: int = 5) -> None:
+def search_chemical(
+    query: str, store: bool = False, limit: int = 5, refresh_cache: bool = False
+) -> None:
     """
     Search for a chemical and display the results.
 
@@ -264,9 +679,13 @@ def search_chemical(query: str, store: bool = False, limit: int = 5) -> None:
         query: Chemical name or CAS number to search for
         store: Whether to store the search results in the database
         limit: Maximum number of results to display
+        refresh_cache: Fetch fresh data instead of using cached responses
     """
+    from src.database.db_manager import get_db
+    from src.scrapers.pubchem_scraper import PubChemScraper
+
     try:
-        with PubChemScraper() as scraper:
+        with PubChemScraper(refresh_cache=refresh_cache) as scraper:
             logger.info(f"Searching for: {query}")
             results = scraper.search_chemical(query)
 
@@ -280,15 +699,18 @@ def search_chemical(query: str, store: bool = False, limit: int = 5) -> None:
             logger.info(
                 f"Found {len(results)} results (displaying {len(display_results)}):"
             )
+            # Write the listing in one call rather than a print per line
+            lines = []
             for i, result in enumerate(display_results, 1):
-                print(f"{i}. {result['name']} (CID: {result['cid']})")
-                if "formula" in result and result["formula"]:
-                    print(f"   Formula: {result['formula']}")
-                if "molecular_weight" in result and result["molecular_weight"]:
-                    print(f"   Molecular Weight: {result['molecular_weight']}")
+                lines.append(f"{i}. {result['name']} (CID: {result['cid']})")
+                if result.get("formula"):
+                    lines.append(f"   Formula: {result['formula']}")
+                if result.get("molecular_weight"):
+                    lines.append(f"   Molecular Weight: {result['molecular_weight']}")
+            sys.stdout.write("\n".join(lines) + "\n")
 
             if store:
-                db_manager = DatabaseManager()
+                db_manager = get_db()
                 for i, result in enumerate(results, 1):
                     logger.info(
                         f"[{i}/{len(results)}] Extracting detailed data for: {result['name']}"
@@ -318,17 +740,13 @@ def search_chemical(query: str, store: bool = False, limit: int = 5) -> None:
                         logger.error(
                             f"Error processing chemical {result['name']}: {str(e)}"
                         )
-
-                    # Be nice to the API
-                    if i < len(results):
-                        time.sleep(1)
     except Exception as e:
         logger.error(f"Error during chemical search: {str(e)}")
         raise
 
 
 def find_chemical_in_database(
-    db_manager: DatabaseManager, chemical: str
+    db_manager: "DatabaseManager", chemical: str
 ) -> Optional[Dict[str, Any]]:
     """
     Find a chemical in the database using various search strategies.
@@ -340,42 +758,27 @@ def find_chemical_in_database(
     Returns:
         Chemical data dictionary or None if not found
     """
+    # CAS numbers can be looked up directly, skipping the name searches
+    if is_valid_cas(chemical):
+        result = db_manager.get_chemical_by_cas(chemical)
+        if not result:
+            logger.error(f"No chemical found matching: {chemical}")
+        return result
+
     # Expanded search strategies
     search_terms = [chemical]
 
-    # Add variations for common chemicals
-    chemical_variations = {
-        "water": ["water", "oxidane", "H2O"],
-        "ethanol": ["ethanol", "ethyl alcohol", "C2H6O", "alcohol"],
-        "hydrochloric acid": ["hydrochloric acid", "chlorane", "HCl"],
-        "methanol": ["methanol", "methyl alcohol", "CH3OH", "wood alcohol"],
-        "acetone": ["acetone", "propanone", "dimethyl ketone"],
-        "benzene": ["benzene", "C6H6"],
-    }
-
     # Add variations if chemical matches a known variation
-    for key, variations in chemical_variations.items():
-        if chemical.lower() in [v.lower() for v in variations]:
-            search_terms.extend(
-                [v for v in variations if v.lower() != chemical.lower()]
-            )
+    search_terms.extend(_VARIATION_INDEX.get(chemical.lower(), ()))
 
-    # First try searching by name
+    # The searches also match CAS numbers, so an exact CAS lookup afterwards
+    # could only find what they already missed
     results = []
     for term in search_terms:
-        results = db_manager.search_chemicals(term)
+        results = db_manager.search_chemicals(term, limit=1)
         if results:
             break
 
-    if not results:
-        # If no results, try searching by CAS number
-        try:
-            result = db_manager.get_chemical_by_cas(chemical)
-            if result:
-                results = [result]
-        except Exception as e:
-            logger.debug(f"Error in CAS search: {str(e)}")
-
     if not results:
         logger.error(f"No chemical found matching: {chemical}")
         return None
@@ -386,7 +789,7 @@ def find_chemical_in_database(
 
 def query_chemical(
     chemical: str,
-    property: Optional[str] = None,
+    prop_name: Optional[str] = None,
     output_format: str = "text",
     verbose: bool = False,
 ) -> None:
@@ -395,12 +798,14 @@ def query_chemical(
 
     Args:
         chemical: Chemical name or CAS number
-        property: Optional specific property to retrieve
+        prop_name: Optional specific property to retrieve
         output_format: Format for output data (text, json, csv)
         verbose: Whether to show detailed information
     """
+    from src.database.db_manager import get_db
+
     try:
-        db_manager = DatabaseManager()
+        db_manager = get_db()
 
         # Find the chemical in the database
         chemical_data = find_chemical_in_database(db_manager, chemical)
@@ -411,21 +816,21 @@ def query_chemical(
         # Process the chemical data to ensure all properties are extracted
         enhanced_data = process_chemical_data(chemical_data)
 
+        # Look up the requested property once for every output format
+        value = enhanced_data.get(prop_name, "Not found") if prop_name else None
+
         # If output format is not text, handle accordingly
         if output_format == "json":
-            if property:
-                print(json.dumps({property: enhanced_data.get(property, "Not found")}))
+            if prop_name:
+                print(_json_dumps({prop_name: value}))
             else:
-                print(json.dumps(enhanced_data))
+                print(_json_dumps(enhanced_data))
             return
         elif output_format == "csv":
-            import csv
-            import io
-
             output = io.StringIO()
             writer = csv.writer(output)
-            if property:
-                writer.writerow([property, enhanced_data.get(property, "Not found")])
+            if prop_name:
+                writer.writerow([prop_name, value])
             else:
                 writer.writerow(enhanced_data.keys())
                 writer.writerow(enhanced_data.values())
@@ -433,12 +838,11 @@ def query_chemical(
             return
 
         # Default text output format
-        if property:
+        if prop_name:
             # If a specific property is requested
-            value = enhanced_data.get(property, "Not found")
             # For better display, modify certain properties
             if (
-                property == "acute_toxicity_notes"
+                prop_name == "acute_toxicity_notes"
                 and isinstance(value, str)
                 and len(value) > 500
                 and not verbose
@@ -446,212 +850,271 @@ def query_chemical(
                 value = value[:500] + "... (use --verbose to see full text)"
 
             print(
-                f"\n{enhanced_data.get('name', chemical).capitalize()} {property.replace('_', ' ').title()}: {value}"
+                f"\n{enhanced_data.get('name', chemical).capitalize()} {prop_name.replace('_', ' ').title()}: {value}"
             )
         else:
-            # Print all available information
-            print(f"\nChemical Information for: {enhanced_data.get('name', 'Unknown')}")
-            print("=" * 40)
-
-            # Group properties by category for better display
-            categories = {
-                "Identifiers": ["id", "cas_number", "name", "formula"],
-                "Physical Properties": [
-                    "molecular_weight",
-                    "physical_state",
-                    "color",
-                    "density",
-                    "melting_point",
-                    "boiling_point",
-                    "flash_point",
-                    "solubility",
-                    "vapor_pressure",
-                ],
-                "Toxicity Data": ["ld50", "lc50"],
-                "Safety Information": [
-                    "hazard_statements",
-                    "precautionary_statements",
-                    "ghs_pictograms",
-                    "signal_word",
-                ],
-                "Chemical Properties": [
-                    "xlogp",
-                    "exact_mass",
-                    "monoisotopic_mass",
-                    "tpsa",
-                    "complexity",
-                    "charge",
-                    "h_bond_donor_count",
-                    "h_bond_acceptor_count",
-                    "rotatable_bond_count",
-                    "heavy_atom_count",
-                ],
-                "Source Information": ["source_url", "source_name"],
-                "Computed Values": [
-                    "density_value",
-                    "density_unit",
-                    "melting_point_value",
-                    "melting_point_unit",
-                    "boiling_point_value",
-                    "boiling_point_unit",
-                    "flash_point_value",
-                    "flash_point_unit",
-                    "vapor_pressure_value",
-                    "vapor_pressure_unit",
-                ],
-                "Chemical Identifiers": [
-                    "canonical_smiles",
-                    "isomeric_smiles",
-                    "inchi",
-                    "inchikey",
-                ],
-            }
-
-            # Only show these categories in verbose mode
-            verbose_categories = [
-                "Chemical Properties",
-                "Chemical Identifiers",
-                "Computed Values",
+            # Print all available information, collected into a single write
+            lines = [
+                f"\nChemical Information for: {enhanced_data.get('name', 'Unknown')}",
+                "=" * 40,
             ]
 
             # Output each category
-            for category, props in categories.items():
-                if not verbose and category in verbose_categories:
+            for category, props in _DISPLAY_CATEGORIES:
+                if not verbose and category in _VERBOSE_CATEGORIES:
                     continue
 
-                category_data = {
-                    key: enhanced_data.get(key)
-                    for key in props
-                    if key in enhanced_data and enhanced_data.get(key)
-                }
+                # One lookup per property, keeping only those with a value
+                rows = [
+                    (key, value) for key in props if (value := enhanced_data.get(key))
+                ]
 
-                if category_data:
-                    print(f"\n{category}:")
-                    for key, value in category_data.items():
+                if rows:
+                    lines.append(f"\n{category}:")
+                    for key, value in rows:
                         # Limit display length for longer strings
                         if isinstance(value, str) and len(value) > 100 and not verbose:
                             display_value = value[:97] + "..."
                         else:
                             display_value = value
 
-                        # Format key for display
-                        display_key = key.replace("_", " ").title()
-                        print(f"  {display_key}: {display_value}")
+                        lines.append(f"  {_DISPLAY_NAMES[key]}: {display_value}")
 
             # Show acute toxicity notes separately, with truncation if needed
             if enhanced_data.get("acute_toxicity_notes"):
-                print("\nAcute Toxicity Notes:")
+                lines.append("\nAcute Toxicity Notes:")
                 notes = enhanced_data["acute_toxicity_notes"]
                 if len(notes) > 500 and not verbose:
-                    print(f"  {notes[:500]}...\n  (use --verbose to see full text)")
+                    lines.append(
+                        f"  {notes[:500]}...\n  (use --verbose to see full text)"
+                    )
                 else:
-                    print(f"  {notes}")
+                    lines.append(f"  {notes}")
+
+            sys.stdout.write("\n".join(lines) + "\n")
     except Exception as e:
         logger.error(f"Error during chemical query: {str(e)}")
         raise
 
 
+def _process_one(
+    scraper: "PubChemScraper", chemical: str, results: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch one chemical from PubChem and prepare it for storage.
+
+    Safe to call from several threads at once.
+
+    Args:
+        scraper: PubChemScraper to fetch the chemical with
+        chemical: Chemical name or CAS number
+        results: Search results for the chemical
+
+    Returns:
+        Processed chemical data, or None if it failed
+    """
+    try:
+        if not results:
+            logger.warning(f"No results found for: {chemical}")
+            return None
+
+        # Get the first result
+        result = results[0]
+        logger.info(f"Found: {result['name']} (CID: {result['cid']})")
+
+        # Extract detailed data
+        logger.info(f"Extracting data for: {result['name']}")
+        chemical_data = scraper.extract_chemical_data(result)
+
+        if not chemical_data:
+            logger.warning(f"Failed to extract data for: {result['name']}")
+            return None
+
+        # Process the chemical data to enhance it
+        return process_chemical_data(chemical_data)
+    except Exception as e:
+        logger.error(f"Error processing chemical '{chemical}': {str(e)}")
+        return None
+
+
+def _unique_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield each distinct non-empty line once, stripped, in order.
+
+    Args:
+        lines: Lines to read, e.g. an open file
+
+    Yields:
+        Stripped lines, skipping blank and repeated ones
+    """
+    seen = set()
+    for line in lines:
+        line = line.strip()
+        if line and line not in seen:
+            seen.add(line)
+            yield line
+
+
+def _import_batch(
+    scraper: "PubChemScraper",
+    db_manager: "DatabaseManager",
+    batch: List[str],
+    offset: int,
+    skip_existing: bool,
+    workers: int = _IMPORT_WORKERS,
+) -> None:
+    """
+    Fetch a batch of chemicals from PubChem and store them.
+
+    Args:
+        scraper: PubChemScraper to fetch the chemicals with
+        db_manager: DatabaseManager to store the chemicals in
+        batch: Chemical names or CAS numbers
+        offset: Number of chemicals processed before this batch
+        skip_existing: Skip chemicals already in the database
+        workers: Number of chemicals to fetch concurrently
+    """
+    # Check which chemicals already exist with one query per batch, so they
+    # aren't fetched at all
+    existing = set()
+    if skip_existing:
+        existing = db_manager.search_chemicals_bulk(batch)
+
+    to_fetch = []
+    for i, chemical in enumerate(batch, 1):
+        logger.info(f"[{offset + i}] Processing: {chemical}")
+        if chemical.lower() in existing:
+            logger.info(f"Skipping existing chemical: {chemical}")
+            continue
+        to_fetch.append(chemical)
+
+    # Search for the whole batch at once; only the first result is used
+    search_results = scraper.search_chemicals_bulk(to_fetch, max_results=1)
+
+    # Fetch the batch concurrently so network round trips overlap
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for chemical in to_fetch:
+            results = search_results.get(chemical, [])
+            future = executor.submit(_process_one, scraper, chemical, results)
+            futures[future] = chemical
+
+        batch_rows = []
+        for future in as_completed(futures):
+            try:
+                enhanced_data = future.result()
+            except Exception as e:
+                logger.error(f"Error processing chemical '{futures[future]}': {str(e)}")
+                continue
+            if enhanced_data:
+                batch_rows.append(_intern_fields(enhanced_data))
+
+    # Store the whole batch in one transaction. When skipping existing
+    # chemicals, the upsert also skips those only matched by CAS number
+    if batch_rows:
+        on_conflict = "skip" if skip_existing else "update"
+        stored_ids = db_manager.add_chemicals_bulk(batch_rows, on_conflict=on_conflict)
+        if stored_ids is None:
+            # Don't lose the whole batch to one bad row: store the chemicals
+            # one at a time so only the failing ones are dropped
+            logger.warning("Failed to store this batch, storing chemicals one by one")
+            _store_one_by_one(db_manager, batch_rows, skip_existing)
+        else:
+            logger.info(f"Stored {len(stored_ids)} chemicals from this batch")
+            skipped = len(batch_rows) - len(stored_ids)
+            if skip_existing and skipped > 0:
+                logger.info(f"Skipped {skipped} chemicals already in the database")
+
+
+def _store_one_by_one(
+    db_manager: "DatabaseManager", rows: List[Dict[str, Any]], skip_existing: bool
+) -> None:
+    """
+    Store chemicals one transaction at a time, after a batch failed to store.
+
+    Args:
+        db_manager: DatabaseManager to store the chemicals in
+        rows: Chemical data dictionaries
+        skip_existing: Skip chemicals whose CAS number is already stored
+    """
+    stored = 0
+    failed = []
+    for row in rows:
+        cas_number = row.get("cas_number")
+        if skip_existing and cas_number and db_manager.get_chemical_by_cas(cas_number):
+            logger.info(f"Skipping existing chemical: {row.get('name')}")
+            continue
+        if db_manager.add_chemical(row):
+            stored += 1
+        else:
+            failed.append(row.get("name") or cas_number or "unknown")
+
+    logger.info(f"Stored {stored} chemicals from this batch")
+    if failed:
+        logger.error(f"Failed to store {len(failed)} chemicals: {', '.join(failed)}")
+
+
 def import_chemicals(
     file_path: str,
     skip_existing: bool = False,
-    update_existing: bool = False,
-    batch_size: int = 10,
+    batch_size: int = _IMPORT_BATCH_SIZE,
+    refresh_cache: bool = False,
+    workers: int = _IMPORT_WORKERS,
 ) -> None:
     """
     Import chemicals from a file containing names or CAS numbers.
 
     Args:
         file_path: Path to the input file
-        skip_existing: Skip chemicals already in the database
-        update_existing: Update existing chemicals with new data
+        skip_existing: Skip chemicals already in the database. Otherwise
+            existing chemicals are updated with the new data
         batch_size: Number of chemicals to process in a batch
+        refresh_cache: Fetch fresh data instead of using cached responses
+        workers: Number of chemicals to fetch concurrently
     """
+    from src.database.db_manager import get_db
+    from src.scrapers.pubchem_scraper import PubChemScraper
+
     path = Path(file_path)
     if not path.exists():
         logger.error(f"File not found: {file_path}")
         return
 
     try:
-        with open(path, "r") as f:
-            chemicals = [line.strip() for line in f if line.strip()]
+        f = open(path, "r")
     except Exception as e:
         logger.error(f"Error reading file: {e}")
         return
 
-    logger.info(f"Importing {len(chemicals)} chemicals...")
+    logger.info(f"Importing chemicals from {file_path}...")
 
-    db_manager = DatabaseManager()
-    with PubChemScraper() as scraper:
-        # Process chemicals in batches
-        for batch_start in range(0, len(chemicals), batch_size):
-            batch_end = min(batch_start + batch_size, len(chemicals))
-            batch = chemicals[batch_start:batch_end]
+    db_manager = get_db()
+    imported = 0
+    with f, PubChemScraper(refresh_cache=refresh_cache) as scraper:
+        # Read the file lazily, one batch at a time
+        chemicals = _unique_lines(f)
 
+        batch_number = 0
+        batch = list(itertools.islice(chemicals, batch_size))
+        while batch:
+            batch_number += 1
             logger.info(
-                f"Processing batch {batch_start//batch_size + 1} ({batch_start+1}-{batch_end} of {len(chemicals)})"
+                f"Processing batch {batch_number} ({imported + 1}-{imported + len(batch)})"
             )
+            # The scraper paces requests across batches, so the pool doesn't
+            # need to pause between them
+            _import_batch(scraper, db_manager, batch, imported, skip_existing, workers)
+            imported += len(batch)
+            batch = list(itertools.islice(chemicals, batch_size))
 
-            for i, chemical in enumerate(batch, 1):
-                item_number = batch_start + i
-                logger.info(f"[{item_number}/{len(chemicals)}] Processing: {chemical}")
-
-                # Check if chemical already exists in the database
-                if skip_existing or update_existing:
-                    existing_records = db_manager.search_chemicals(chemical)
-                    if existing_records:
-                        if skip_existing:
-                            logger.info(f"Skipping existing chemical: {chemical}")
-                            continue
-                        # else: update_existing is True, so we'll continue and update
-
-                # Search for the chemical
-                try:
-                    results = scraper.search_chemical(chemical)
-                    if not results:
-                        logger.warning(f"No results found for: {chemical}")
-                        continue
-
-                    # Get the first result
-                    result = results[0]
-                    logger.info(f"Found: {result['name']} (CID: {result['cid']})")
-
-                    # Extract detailed data
-                    logger.info(f"Extracting data for: {result['name']}")
-                    chemical_data = scraper.extract_chemical_data(result)
-
-                    if chemical_data:
-                        # Process the chemical data to enhance it
-                        enhanced_data = process_chemical_data(chemical_data)
-
-                        # Add to database
-                        chem_id = db_manager.add_chemical(enhanced_data)
-                        if chem_id:
-                            logger.info(f"Stored chemical with ID: {chem_id}")
-                        else:
-                            logger.warning(
-                                f"Failed to store chemical: {result['name']}"
-                            )
-                    else:
-                        logger.warning(f"Failed to extract data for: {result['name']}")
-                except Exception as e:
-                    logger.error(f"Error processing chemical '{chemical}': {str(e)}")
-                    continue
-
-                # Be nice to the API - limit rate
-                if i < len(batch):
-                    time.sleep(1)
-
-            # Add a longer delay between batches
-            if batch_end < len(chemicals):
-                time.sleep(5)
-
-    logger.info("Import completed.")
+    logger.info(f"Import completed ({imported} chemicals).")
 
 
 def export_database(
     output_path: Optional[str] = None,
     output_format: str = "csv",
     filter_expr: Optional[str] = None,
+    batch_size: int = _EXPORT_BATCH_SIZE,
 ) -> None:
     """
     Export the database to a file.
@@ -660,8 +1123,11 @@ def export_database(
         output_path: Path to the output file
         output_format: Format for output (csv, json, excel)
         filter_expr: Filter expression for chemicals (e.g. 'cas_number=64-17-5')
+        batch_size: Number of chemicals to read from the database at a time
     """
-    db_manager = DatabaseManager()
+    from src.database.db_manager import get_db
+
+    db_manager = get_db()
 
     # Get all chemicals with optional filtering
     if filter_expr:
@@ -680,11 +1146,15 @@ def export_database(
             )
             return
     else:
-        chemicals = db_manager.get_all_chemicals()
+        chemicals = db_manager.iter_chemicals(batch_size=batch_size)
 
-    if not chemicals:
+    # Peek at the first chemical so an empty database isn't exported
+    chemicals = iter(chemicals)
+    first = next(chemicals, None)
+    if first is None:
         logger.error("No chemicals in database to export.")
         return
+    chemicals = itertools.chain([first], chemicals)
 
     # Define default output path if not provided
     if not output_path:
@@ -701,27 +1171,37 @@ def export_database(
         output_path = str(data_dir / filename)
 
     try:
-        # Process each chemical to ensure all properties are extracted
-        enhanced_chemicals = [process_chemical_data(chem) for chem in chemicals]
+        # Process each chemical as it is written rather than all up front
+        enhanced_chemicals = (process_chemical_data(chem) for chem in chemicals)
+        count = 0
 
         if output_format == "csv":
-            path = db_manager.export_to_csv(output_path, enhanced_chemicals)
+            # A large write buffer turns many small row writes into few syscalls
+            with open(output_path, "w", newline="", buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=list(first))
+                writer.writeheader()
+                for chem in enhanced_chemicals:
+                    writer.writerow(chem)
+                    count += 1
+            path = output_path
         elif output_format == "json":
-            with open(output_path, "w") as f:
-                json.dump(enhanced_chemicals, f, indent=2)
+            with open(output_path, "wb", buffering=1 << 20) as f:
+                f.write(b"[")
+                for chem in enhanced_chemicals:
+                    f.write(b",\n  " if count else b"\n  ")
+                    f.write(_json_dumpb(chem))
+                    count += 1
+                f.write(b"\n]\n")
             path = output_path
         elif output_format == "excel":
-            import pandas as pd
-
-            df = pd.DataFrame(enhanced_chemicals)
-            df.to_excel(output_path, index=False)
+            count = _write_excel(output_path, list(first), enhanced_chemicals)
             path = output_path
         else:
             logger.error(f"Unsupported output format: {output_format}")
             return
 
         if path:
-            logger.info(f"Exported {len(enhanced_chemicals)} chemicals to: {path}")
+            logger.info(f"Exported {count} chemicals to: {path}")
         else:
             logger.error("Failed to export database.")
     except Exception as e:
@@ -730,7 +1210,9 @@ def export_database(
 
 def count_chemicals() -> None:
     """Count the number of chemicals in the database."""
-    db_manager = DatabaseManager()
+    from src.database.db_manager import get_db
+
+    db_manager = get_db()
     count = db_manager.count_chemicals()
     logger.info(f"Total chemicals in database: {count}")
 
@@ -743,7 +1225,23 @@ def delete_chemical(chemical: str, force: bool = False) -> None:
         chemical: Chemical name or CAS number to delete
         force: Skip confirmation if True
     """
-    db_manager = DatabaseManager()
+    from src.database.db_manager import get_db
+
+    db_manager = get_db()
+
+    if force:
+        # Without a confirmation step an exact match can be found and deleted
+        # with a single statement
+        matches = db_manager.delete_by_identifier(chemical)
+        if len(matches) == 1:
+            logger.info(f"Successfully deleted chemical: {matches[0]['name']}")
+            return
+        if matches:
+            logger.error(
+                f"{len(matches)} chemicals match '{chemical}', "
+                "use the CAS number to choose one"
+            )
+            return
 
     # Find the chemical in the database
     chemical_data = find_chemical_in_database(db_manager, chemical)
@@ -776,7 +1274,10 @@ def update_chemical(chemical: str, refresh: bool = False) -> None:
         chemical: Chemical name or CAS number to update
         refresh: Whether to fetch fresh data from the source
     """
-    db_manager = DatabaseManager()
+    from src.database.db_manager import get_db
+    from src.scrapers.pubchem_scraper import PubChemScraper
+
+    db_manager = get_db()
 
     # Find the chemical in the database
     chemical_data = find_chemical_in_database(db_manager, chemical)
@@ -786,8 +1287,8 @@ def update_chemical(chemical: str, refresh: bool = False) -> None:
 
     try:
         if refresh:
-            # Fetch fresh data from PubChem
-            with PubChemScraper() as scraper:
+            # Fetch fresh data from PubChem, bypassing cached responses
+            with PubChemScraper(refresh_cache=True) as scraper:
                 logger.info(f"Fetching fresh data for: {chemical_data.get('name')}")
 
                 # Use the CAS number or name to search
@@ -824,10 +1325,11 @@ def update_chemical(chemical: str, refresh: bool = False) -> None:
             logger.info(f"Updated chemical with ID: {chem_id}")
 
             # Show updated properties
-            print(f"\nUpdated properties for {enhanced_data.get('name')}:")
-            for key, value in enhanced_data.items():
-                if key in ["ld50", "lc50"] and value:
-                    print(f"  {key.upper()}: {value}")
+            lines = [f"\nUpdated properties for {enhanced_data.get('name')}:"]
+            for key in ("ld50", "lc50"):
+                if enhanced_data.get(key):
+                    lines.append(f"  {key.upper()}: {enhanced_data[key]}")
+            sys.stdout.write("\n".join(lines) + "\n")
     except Exception as e:
         logger.error(f"Error updating chemical '{chemical}': {str(e)}")
 
@@ -842,26 +1344,42 @@ def show_version() -> None:
 
 def main() -> int:
     """Main entry point."""
+    # Configure logging here rather than on import, so importing this module
+    # doesn't install handlers on the root logger (a no-op if it has some)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
     try:
         parser = setup_argparse()
         args = parser.parse_args()
 
         if args.command == "search":
             limit = getattr(args, "limit", 5)
-            search_chemical(args.query, args.store, limit)
+            refresh_cache = getattr(args, "refresh_cache", False)
+            search_chemical(args.query, args.store, limit, refresh_cache)
         elif args.command == "query":
             output_format = getattr(args, "format", "text")
             verbose = getattr(args, "verbose", False)
             query_chemical(args.chemical, args.property, output_format, verbose)
         elif args.command == "import":
             skip_existing = getattr(args, "skip_existing", False)
-            update_existing = getattr(args, "update", False)
-            batch_size = getattr(args, "batch_size", 10)
-            import_chemicals(args.file, skip_existing, update_existing, batch_size)
+            batch_size = getattr(args, "batch_size", _IMPORT_BATCH_SIZE)
+            refresh_cache = getattr(args, "refresh_cache", False)
+            workers = getattr(args, "workers", _IMPORT_WORKERS)
+            import_chemicals(
+                args.file,
+                skip_existing,
+                batch_size,
+                refresh_cache,
+                workers,
+            )
         elif args.command == "export":
             output_format = getattr(args, "format", "csv")
             filter_expr = getattr(args, "filter", None)
-            export_database(args.output, output_format, filter_expr)
+            batch_size = getattr(args, "batch_size", _EXPORT_BATCH_SIZE)
+            export_database(args.output, output_format, filter_expr, batch_size)
         elif args.command == "count":
             count_chemicals()
         elif args.command == "delete":
@@ -879,8 +1397,6 @@ def main() -> int:
         return 1
     except Exception as e:
         logger.error(f"Error: {str(e)}")
-        import traceback
-
         logger.debug(traceback.format_exc())
         return 1
 
@@ -9,7 +9,8 @@ import json
 import logging
 import time
 import traceback
-from typing import Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 import requests
 
@@ -22,6 +23,7 @@ from src.utils.helpers import (
     parse_physical_property,
     validate_chemical_data,
 )
+from src.utils.rate_limit import RateLimiter
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +32,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# PubChem allows 5 requests per second per client, so every scraper in the
+# process shares one limiter. A capacity of 1 spaces the requests evenly, as
+# a full bucket would allow up to 10 in the second after an idle spell
+_PUBCHEM_LIMITER = RateLimiter(rate=5, capacity=1)
+
+
+# Chemical data fields filled from PubChem's basic properties. Missing text
+# properties become "" and missing numeric ones None
+_TEXT_PROPERTIES = (
+    ("name", "IUPACName"),
+    ("formula", "MolecularFormula"),
+    ("canonical_smiles", "CanonicalSMILES"),
+    ("isomeric_smiles", "IsomericSMILES"),
+    ("inchi", "InChI"),
+    ("inchikey", "InChIKey"),
+)
+_NUMERIC_PROPERTIES = (
+    ("molecular_weight", "MolecularWeight", float),
+    ("xlogp", "XLogP", float),
+    ("exact_mass", "ExactMass", float),
+    ("monoisotopic_mass", "MonoisotopicMass", float),
+    ("tpsa", "TPSA", float),
+    ("complexity", "Complexity", float),
+    ("charge", "Charge", int),
+    ("h_bond_donor_count", "HBondDonorCount", int),
+    ("h_bond_acceptor_count", "HBondAcceptorCount", int),
+    ("rotatable_bond_count", "RotatableBondCount", int),
+    ("heavy_atom_count", "HeavyAtomCount", int),
+)
+
+# Full record sections holding physical and hazard properties, and the
+# chemical data field each one fills ("" when missing)
+_HAZARD_HEADINGS = {
+    "Physical Description": "physical_state",
+    "Color/Form": "color",
+    "Density": "density",
+    "Melting Point": "melting_point",
+    "Boiling Point": "boiling_point",
+    "Flash Point": "flash_point",
+    "Solubility": "solubility",
+    "Vapor Pressure": "vapor_pressure",
+}
+_HAZARD_FIELDS = tuple(_HAZARD_HEADINGS.values())
+
+# GHS Classification subsections and the result field each one fills. List
+# fields join all of the subsection's strings, the others keep the first one
+_GHS_HEADINGS = {
+    "GHS Hazard Statements": ("hazard_statements", True),
+    "Precautionary Statement Codes": ("precautionary_statements", True),
+    "Pictogram(s)": ("pictograms", True),
+    "GHS Signal Word": ("signal_word", False),
+}
+
+
+def _markup_strings(information: Iterable[Dict]) -> Iterator[str]:
+    """
+    Yield the text of a PUG View section's Information entries.
+
+    Args:
+        information: The section's Information entries
+
+    Yields:
+        Each String of the entries' StringWithMarkup values, in order
+    """
+    for info in information:
+        for markup in info.get("Value", {}).get("StringWithMarkup", ()):
+            if "String" in markup:
+                yield markup["String"]
+
 
 class PubChemScraper(BaseScraper):
     """
@@ -39,13 +110,23 @@ class PubChemScraper(BaseScraper):
     retrieve chemical properties.
     """
 
-    def __init__(self, use_cache: bool = True, cache_max_age: int = 86400):
+    def __init__(
+        self,
+        use_cache: bool = True,
+        cache_max_age: int = 86400,
+        refresh_cache: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Initialize the PubChem scraper.
 
         Args:
             use_cache: Whether to use caching for API requests
             cache_max_age: Maximum age for cached responses in seconds (default: 1 day)
+            refresh_cache: Ignore cached responses and fetch fresh ones, which
+                are still written to the cache
+            rate_limiter: Limiter for requests sent to PubChem, by default one
+                shared by all scrapers that allows 5 requests per second
         """
         super().__init__(base_url="https://pubchem.ncbi.nlm.nih.gov/rest/pug")
         self.search_url = (
@@ -62,9 +143,19 @@ class PubChemScraper(BaseScraper):
 
         # Set up caching
         self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
         if use_cache:
             self.cache = CacheManager(max_age=cache_max_age)
 
+        # Only requests that go to PubChem are rate limited, cache hits aren't
+        self.rate_limiter = rate_limiter or _PUBCHEM_LIMITER
+
+        # Properties fetched in bulk for search_chemicals_bulk results, kept
+        # until the compound's data is extracted so they aren't requested
+        # again
+        self._pending_properties: Dict[str, Dict] = {}
+        self._pending_cas_numbers: Dict[str, Optional[str]] = {}
+
         # Retry configuration
         self.max_retries = 3
         self.retry_delay = 2  # seconds
@@ -92,23 +183,28 @@ class PubChemScraper(BaseScraper):
             ]
         )
 
-    def _api_request(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+    def _api_request(
+        self, url: str, params: Optional[Dict] = None, as_text: bool = False
+    ) -> Optional[Union[Dict, str]]:
         """
         Make an API request with caching and retry functionality.
 
         Args:
             url: API URL
             params: Optional parameters for the request
+            as_text: Return the response body as text instead of decoding it
+                as JSON, for PUG REST's TXT output
 
         Returns:
-            JSON response as a dictionary, or None if request failed
+            JSON response as a dictionary (or the text response), or None if
+            request failed
         """
         cache_key = url
         if params:
             cache_key += json.dumps(params, sort_keys=True)
 
         # Try to get from cache first
-        if self.use_cache:
+        if self.use_cache and not self.refresh_cache:
             cached_data = self.cache.get(cache_key)
             if cached_data:
                 logger.debug(f"Using cached response for: {url}")
@@ -117,6 +213,9 @@ class PubChemScraper(BaseScraper):
         # Make the API request with retries
         for attempt in range(1, self.max_retries + 1):
             try:
+                # Be nice to the API
+                self.rate_limiter.acquire()
+
                 # Use the session from the parent BaseScraper class
                 if params:
                     response = self.session.get(url, params=params)
@@ -124,7 +223,10 @@ class PubChemScraper(BaseScraper):
                     response = self.session.get(url)
 
                 response.raise_for_status()
-                data = response.json()
+                if as_text:
+                    data = response.text
+                else:
+                    data = self.parse_json(response.content)
 
                 # Cache the response
                 if self.use_cache:
@@ -184,21 +286,9 @@ class PubChemScraper(BaseScraper):
             Full JSON data or None if retrieval fails
         """
         try:
-            # Check cache first
-            if self.use_cache:
-                cached_data = self.cache.get(f"full_json_{cid}")
-                if cached_data:
-                    return cached_data
-
-            # Fetch the full JSON data
-            url = self.full_json_url.format(cid)
-            data = self._api_request(url)
-
-            # Cache the response
-            if self.use_cache and data:
-                self.cache.set(f"full_json_{cid}", data)
-
-            return data
+            # _api_request caches the response under its URL, so the record,
+            # often hundreds of KB, is only stored once
+            return self._api_request(self.full_json_url.format(cid))
         except Exception as e:
             logger.error(f"Error retrieving full JSON for CID {cid}: {str(e)}")
             logger.debug(traceback.format_exc())
@@ -294,6 +384,67 @@ class PubChemScraper(BaseScraper):
         Returns:
             List of dictionaries containing search results
         """
+        try:
+            # Limit to first 5 results for efficiency, and get their basic
+            # properties with a single request
+            cids = self._search_cids(query)[:5]
+            return self._search_results(cids, self._get_properties_bulk(cids))
+        except Exception as e:
+            logger.error(f"Error searching for chemical '{query}': {str(e)}")
+            logger.debug(traceback.format_exc())
+            return []
+
+    def search_chemicals_bulk(
+        self, queries: Iterable[str], max_results: int = 5, chunk_size: int = 100
+    ) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Search for several chemicals at once.
+
+        PubChem resolves one name per request, so those lookups run
+        concurrently. The basic properties of all results are then fetched
+        together, one request per chunk_size compounds.
+
+        Args:
+            queries: Chemical names or identifiers to search for
+            max_results: Maximum number of results per query
+            chunk_size: Number of compounds per properties request
+
+        Returns:
+            Dictionary mapping each query to its list of search results
+        """
+        queries = list(dict.fromkeys(queries))
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            found = executor.map(self._search_cids, queries)
+            cids_by_query = {
+                query: cids[:max_results] for query, cids in zip(queries, found)
+            }
+
+        all_cids = list(
+            dict.fromkeys(cid for cids in cids_by_query.values() for cid in cids)
+        )
+        props_by_cid = {}
+        for start in range(0, len(all_cids), chunk_size):
+            chunk = all_cids[start : start + chunk_size]
+            props_by_cid.update(self._get_properties_bulk(chunk, keep=True))
+            # Bulk searches are followed by extraction, so look up the CAS
+            # numbers for the whole chunk now rather than one by one later
+            self._get_cas_numbers_bulk(chunk)
+
+        return {
+            query: self._search_results(cids, props_by_cid)
+            for query, cids in cids_by_query.items()
+        }
+
+    def _search_cids(self, query: str) -> List[int]:
+        """
+        Find the PubChem Compound IDs matching a name or identifier.
+
+        Args:
+            query: Chemical name or identifier to search for
+
+        Returns:
+            List of matching CIDs, best match first
+        """
         try:
             # First check if query is a CAS number
             cas_number = parse_cas_number(query)
@@ -311,29 +462,38 @@ class PubChemScraper(BaseScraper):
                 logger.warning(f"No results found for query: {query}")
                 return []
 
-            cids = data["IdentifierList"]["CID"]
-
-            # Get basic info for each CID
-            results = []
-            for cid in cids[:5]:  # Limit to first 5 results for efficiency
-                # Get basic properties for each compound
-                time.sleep(0.2)  # Be nice to the API
-                props = self._get_properties(cid)
-                if props:
-                    result = {
-                        "cid": cid,
-                        "name": props.get("IUPACName", "Unknown"),
-                        "formula": props.get("MolecularFormula", ""),
-                        "molecular_weight": props.get("MolecularWeight", ""),
-                    }
-                    results.append(result)
-
-            return results
+            return data["IdentifierList"]["CID"]
         except Exception as e:
             logger.error(f"Error searching for chemical '{query}': {str(e)}")
             logger.debug(traceback.format_exc())
             return []
 
+    def _search_results(
+        self, cids: List[int], props_by_cid: Dict[int, Dict]
+    ) -> List[Dict[str, str]]:
+        """
+        Build search results from compound properties.
+
+        Args:
+            cids: PubChem Compound IDs, in result order
+            props_by_cid: Basic properties of each compound by CID
+
+        Returns:
+            List of dictionaries containing search results
+        """
+        results = []
+        for cid in cids:
+            props = props_by_cid.get(cid)
+            if props:
+                result = {
+                    "cid": cid,
+                    "name": props.get("IUPACName", "Unknown"),
+                    "formula": props.get("MolecularFormula", ""),
+                    "molecular_weight": props.get("MolecularWeight", ""),
+                }
+                results.append(result)
+        return results
+
     def extract_chemical_data(
         self, identifier: Union[str, Dict[str, str]]
     ) -> Dict[str, any]:
@@ -377,20 +537,30 @@ class PubChemScraper(BaseScraper):
             if not props:
                 return {}
 
-            # Get CAS number
-            cas_number = self._get_cas_number(cid)
+            # The CAS number, GHS classifications and full JSON record don't
+            # depend on each other, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                cas_future = executor.submit(self._get_cas_number, cid)
+                ghs_future = executor.submit(
+                    self._api_request, self.ghs_classifications_url.format(cid)
+                )
+                full_json_future = executor.submit(self._get_full_json_data, cid)
 
-            # Get GHS classifications
-            ghs_data = self._get_ghs_data(cid)
+            cas_number = self._future_result(cas_future, None)
+            full_json = self._future_result(full_json_future, None)
 
-            # Get hazards information
-            hazards_data = self._get_hazards_data(cid)
+            # Read the GHS data only now, so that falling back to the full
+            # JSON record reuses it rather than downloading it a second time
+            ghs_data = self._parse_ghs_data(
+                cid, self._future_result(ghs_future, None), full_json
+            )
 
-            # Get full JSON data for additional information
-            full_json = self._get_full_json_data(cid)
+            # Get hazards information from the full JSON record
+            hazards_data = self._get_hazards_data(cid, full_json)
 
-            # Log the full JSON data for debugging
-            if full_json:
+            # Dump the full JSON data for debugging. Records can be several
+            # MB, so only do this when debug logging is enabled
+            if full_json and logger.isEnabledFor(logging.DEBUG):
                 with open(f"full_json_{cid}.json", "w") as f:
                     json.dump(full_json, f, indent=2)
 
@@ -402,86 +572,37 @@ class PubChemScraper(BaseScraper):
                 logger.info(f"Extracted toxicity data for {cid}: {toxicity_data}")
 
             # Combine all data
-            chemical_data = {
-                "cas_number": cas_number,
-                "name": props.get("IUPACName", ""),
-                "formula": props.get("MolecularFormula", ""),
-                "molecular_weight": (
-                    float(props.get("MolecularWeight", 0))
-                    if props.get("MolecularWeight")
-                    else None
-                ),
-                "canonical_smiles": props.get("CanonicalSMILES", ""),
-                "isomeric_smiles": props.get("IsomericSMILES", ""),
-                "inchi": props.get("InChI", ""),
-                "inchikey": props.get("InChIKey", ""),
-                "xlogp": (
-                    float(props.get("XLogP"))
-                    if props.get("XLogP") is not None
-                    else None
-                ),
-                "exact_mass": (
-                    float(props.get("ExactMass")) if props.get("ExactMass") else None
-                ),
-                "monoisotopic_mass": (
-                    float(props.get("MonoisotopicMass"))
-                    if props.get("MonoisotopicMass")
-                    else None
-                ),
-                "tpsa": float(props.get("TPSA")) if props.get("TPSA") else None,
-                "complexity": (
-                    float(props.get("Complexity")) if props.get("Complexity") else None
-                ),
-                "charge": (
-                    int(props.get("Charge"))
-                    if props.get("Charge") is not None
-                    else None
-                ),
-                "h_bond_donor_count": (
-                    int(props.get("HBondDonorCount"))
-                    if props.get("HBondDonorCount") is not None
-                    else None
-                ),
-                "h_bond_acceptor_count": (
-                    int(props.get("HBondAcceptorCount"))
-                    if props.get("HBondAcceptorCount") is not None
-                    else None
-                ),
-                "rotatable_bond_count": (
-                    int(props.get("RotatableBondCount"))
-                    if props.get("RotatableBondCount") is not None
-                    else None
-                ),
-                "heavy_atom_count": (
-                    int(props.get("HeavyAtomCount"))
-                    if props.get("HeavyAtomCount") is not None
-                    else None
-                ),
-                "physical_state": hazards_data.get("physical_state", ""),
-                "color": hazards_data.get("color", ""),
-                "density": hazards_data.get("density", ""),
-                "melting_point": hazards_data.get("melting_point", ""),
-                "boiling_point": hazards_data.get("boiling_point", ""),
-                "flash_point": hazards_data.get("flash_point", ""),
-                "solubility": hazards_data.get("solubility", ""),
-                "vapor_pressure": hazards_data.get("vapor_pressure", ""),
-                "hazard_statements": ghs_data.get("hazard_statements", ""),
-                "precautionary_statements": ghs_data.get(
-                    "precautionary_statements", ""
-                ),
-                "ghs_pictograms": ghs_data.get("pictograms", ""),
-                "signal_word": ghs_data.get("signal_word", ""),
-                "source_url": f"https://pubchem.ncbi.nlm.nih.gov/compound/{cid}",
-                "source_name": "PubChem",
+            chemical_data = {"cas_number": cas_number}
+            chemical_data.update(
+                (field, props.get(key, "")) for field, key in _TEXT_PROPERTIES
+            )
+            for field, key, convert in _NUMERIC_PROPERTIES:
+                value = props.get(key)
+                try:
+                    chemical_data[field] = None if value is None else convert(value)
+                except (TypeError, ValueError):
+                    # One malformed value shouldn't lose the whole record
+                    logger.warning(f"Invalid {key} for CID {cid}: {value!r}")
+                    chemical_data[field] = None
+            chemical_data.update(
+                (field, hazards_data.get(field, "")) for field in _HAZARD_FIELDS
+            )
+            chemical_data.update(
+                hazard_statements=ghs_data.get("hazard_statements", ""),
+                precautionary_statements=ghs_data.get("precautionary_statements", ""),
+                ghs_pictograms=ghs_data.get("pictograms", ""),
+                signal_word=ghs_data.get("signal_word", ""),
+                source_url=f"https://pubchem.ncbi.nlm.nih.gov/compound/{cid}",
+                source_name="PubChem",
                 # Add toxicity data
-                "lc50": toxicity_data.get("lc50"),
-                "ld50": (
+                lc50=toxicity_data.get("lc50"),
+                ld50=(
                     toxicity_data.get("ld50", "").strip()
                     if toxicity_data.get("ld50")
                     else None
                 ),
-                "acute_toxicity_notes": toxicity_data.get("acute_toxicity_notes"),
-            }
+                acute_toxicity_notes=toxicity_data.get("acute_toxicity_notes"),
+            )
 
             # Extract structured hazard data
             if chemical_data["hazard_statements"]:
@@ -519,6 +640,25 @@ class PubChemScraper(BaseScraper):
             logger.debug(traceback.format_exc())
             return {}
 
+    @staticmethod
+    def _future_result(future, default):
+        """
+        Get the result of a lookup run on a thread pool.
+
+        Args:
+            future: Future of the lookup
+            default: Value to use if the lookup raised an exception
+
+        Returns:
+            The lookup's result, or default if it failed
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"Error fetching chemical data: {str(e)}")
+            logger.debug(traceback.format_exc())
+            return default
+
     def _get_properties(self, cid: str) -> Dict[str, str]:
         """
         Get basic properties for a compound by CID.
@@ -529,6 +669,10 @@ class PubChemScraper(BaseScraper):
         Returns:
             Dictionary of properties
         """
+        props = self._pending_properties.pop(str(cid), None)
+        if props:
+            return props
+
         url = self.properties_url.format(cid, self.basic_properties)
         data = self._api_request(url)
 
@@ -542,6 +686,45 @@ class PubChemScraper(BaseScraper):
             logger.error(f"Error parsing properties for CID {cid}: {str(e)}")
             return {}
 
+    def _get_properties_bulk(
+        self, cids: List[int], keep: bool = False
+    ) -> Dict[int, Dict]:
+        """
+        Get basic properties for several compounds with a single request.
+
+        Args:
+            cids: PubChem Compound IDs
+            keep: Keep the properties until the compounds are extracted. Only
+                set this when extraction follows, as they are held until then
+
+        Returns:
+            Dictionary mapping each CID to its properties
+        """
+        if not cids:
+            return {}
+
+        url = self.properties_url.format(
+            ",".join(str(cid) for cid in cids), self.basic_properties
+        )
+        data = self._api_request(url)
+
+        if not data or "PropertyTable" not in data:
+            return {}
+
+        try:
+            props_by_cid = {
+                props["CID"]: props for props in data["PropertyTable"]["Properties"]
+            }
+        except (KeyError, TypeError) as e:
+            logger.error(f"Error parsing properties for CIDs {cids}: {str(e)}")
+            return {}
+
+        if keep:
+            self._pending_properties.update(
+                (str(cid), props) for cid, props in props_by_cid.items()
+            )
+        return props_by_cid
+
     def _get_cas_number(self, cid: str) -> Optional[str]:
         """
         Get CAS registry number for a compound by CID.
@@ -552,40 +735,108 @@ class PubChemScraper(BaseScraper):
         Returns:
             CAS registry number or None
         """
-        synonyms_url = f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/{cid}/synonyms/JSON"
+        if str(cid) in self._pending_cas_numbers:
+            return self._pending_cas_numbers.pop(str(cid))
+
+        # The TXT output lists one synonym per line, so there is no JSON to
+        # decode and the response is smaller
+        synonyms_url = (
+            f"https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/{cid}/synonyms/TXT"
+        )
+        text = self._api_request(synonyms_url, as_text=True)
+
+        if not text:
+            return None
+
+        # Look for CAS number pattern and validate each potential CAS number,
+        # skipping the many names that can't contain one
+        for synonym in text.splitlines():
+            if "-" not in synonym:
+                continue
+            cas_number = parse_cas_number(synonym)
+            if cas_number:
+                return cas_number
+
+        return None
+
+    def _get_cas_numbers_bulk(self, cids: List[int]) -> Dict[int, Optional[str]]:
+        """
+        Get CAS registry numbers for several compounds with a single request.
+
+        This uses the JSON output, since with several CIDs the TXT output
+        doesn't say which compound each synonym belongs to.
+
+        Args:
+            cids: PubChem Compound IDs
+
+        Returns:
+            Dictionary mapping each CID to its CAS registry number or None
+        """
+        if not cids:
+            return {}
+
+        synonyms_url = (
+            "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/"
+            f"{','.join(str(cid) for cid in cids)}/synonyms/JSON"
+        )
         data = self._api_request(synonyms_url)
 
         if not data or "InformationList" not in data:
-            return None
+            return {}
 
+        cas_by_cid = {}
         try:
-            synonyms = data["InformationList"]["Information"][0].get("Synonym", [])
-
-            # Look for CAS number pattern and validate each potential CAS number
-            for synonym in synonyms:
-                cas_number = parse_cas_number(synonym)
-                if cas_number:
-                    return cas_number
+            for information in data["InformationList"]["Information"]:
+                cas_number = None
+                for synonym in information.get("Synonym", []):
+                    if "-" not in synonym:
+                        continue
+                    cas_number = parse_cas_number(synonym)
+                    if cas_number:
+                        break
+                cas_by_cid[information["CID"]] = cas_number
+        except (KeyError, TypeError) as e:
+            logger.error(f"Error parsing synonyms for CIDs {cids}: {str(e)}")
+            return {}
 
-            return None
-        except (KeyError, IndexError) as e:
-            logger.error(f"Error parsing synonyms for CID {cid}: {str(e)}")
-            return None
+        self._pending_cas_numbers.update(
+            (str(cid), cas_number) for cid, cas_number in cas_by_cid.items()
+        )
+        return cas_by_cid
 
-    def _get_ghs_data(self, cid: str) -> Dict[str, any]:
+    def _get_ghs_data(
+        self, cid: str, full_json: Optional[Dict] = None
+    ) -> Dict[str, any]:
         """
         Get GHS classification data for a compound by CID.
 
         Args:
             cid: PubChem Compound ID
+            full_json: The compound's full JSON record, if already fetched
 
         Returns:
             Dictionary containing GHS classifications
         """
         # Attempt to get data from the specific GHS classification URL
         url = self.ghs_classifications_url.format(cid)
-        data = self._api_request(url)
+        return self._parse_ghs_data(cid, self._api_request(url), full_json)
+
+    def _parse_ghs_data(
+        self, cid: str, data: Optional[Dict], full_json: Optional[Dict] = None
+    ) -> Dict[str, any]:
+        """
+        Read GHS classification data from a compound's GHS classification record.
+
+        Args:
+            cid: PubChem Compound ID
+            data: The compound's GHS classification record, or None if there
+                isn't one
+            full_json: The compound's full JSON record, if already fetched.
+                It is used when there is no GHS classification record
 
+        Returns:
+            Dictionary containing GHS classifications
+        """
         result = {
             "hazard_statements": "",
             "precautionary_statements": "",
@@ -595,166 +846,71 @@ class PubChemScraper(BaseScraper):
 
         if not data or "Record" not in data or "Section" not in data["Record"]:
             # Try full JSON view as a fallback
-            full_json = self._get_full_json_data(cid)
+            if full_json is None:
+                full_json = self._get_full_json_data(cid)
             if not full_json or "Record" not in full_json:
                 return result
 
             data = full_json
 
         try:
-            sections = data["Record"].get("Section", [])
-
-            for section in sections:
-                if (
-                    "TOCHeading" in section
-                    and section["TOCHeading"] == "GHS Classification"
-                ):
-                    if "Section" not in section:
+            for section in data["Record"].get("Section", []):
+                if section.get("TOCHeading") != "GHS Classification":
+                    continue
+
+                for subsection in section.get("Section", ()):
+                    field, is_list = _GHS_HEADINGS.get(
+                        subsection.get("TOCHeading"), (None, False)
+                    )
+                    if field is None:
                         continue
 
-                    for subsection in section["Section"]:
-                        if "TOCHeading" not in subsection:
-                            continue
-
-                        heading = subsection["TOCHeading"]
-
-                        if heading == "GHS Hazard Statements":
-                            statements = []
-                            if "Information" in subsection:
-                                for info in subsection["Information"]:
-                                    if (
-                                        "Value" in info
-                                        and "StringWithMarkup" in info["Value"]
-                                    ):
-                                        for markup in info["Value"]["StringWithMarkup"]:
-                                            if "String" in markup:
-                                                statements.append(markup["String"])
-                            result["hazard_statements"] = "; ".join(statements)
-
-                        elif heading == "Precautionary Statement Codes":
-                            statements = []
-                            if "Information" in subsection:
-                                for info in subsection["Information"]:
-                                    if (
-                                        "Value" in info
-                                        and "StringWithMarkup" in info["Value"]
-                                    ):
-                                        for markup in info["Value"]["StringWithMarkup"]:
-                                            if "String" in markup:
-                                                statements.append(markup["String"])
-                            result["precautionary_statements"] = "; ".join(statements)
-
-                        elif heading == "Pictogram(s)":
-                            pictograms = []
-                            if "Information" in subsection:
-                                for info in subsection["Information"]:
-                                    if (
-                                        "Value" in info
-                                        and "StringWithMarkup" in info["Value"]
-                                    ):
-                                        for markup in info["Value"]["StringWithMarkup"]:
-                                            if "String" in markup:
-                                                pictograms.append(markup["String"])
-                            result["pictograms"] = "; ".join(pictograms)
-
-                        elif heading == "GHS Signal Word":
-                            if (
-                                "Information" in subsection
-                                and subsection["Information"]
-                            ):
-                                info = subsection["Information"][0]
-                                if (
-                                    "Value" in info
-                                    and "StringWithMarkup" in info["Value"]
-                                ):
-                                    markup = info["Value"]["StringWithMarkup"][0]
-                                    if "String" in markup:
-                                        result["signal_word"] = markup["String"]
+                    strings = _markup_strings(subsection.get("Information", ()))
+                    result[field] = "; ".join(strings) if is_list else next(strings, "")
 
             return result
         except (KeyError, IndexError) as e:
             logger.error(f"Error parsing GHS data for CID {cid}: {str(e)}")
             return result
 
-    def _get_hazards_data(self, cid: str) -> Dict[str, str]:
+    def _get_hazards_data(
+        self, cid: str, full_json: Optional[Dict] = None
+    ) -> Dict[str, str]:
         """
         Get physical properties and hazard data for a compound by CID.
 
         Args:
             cid: PubChem Compound ID
+            full_json: The compound's full JSON record, if already fetched
 
         Returns:
             Dictionary containing physical properties and hazard data
         """
         # Default result dictionary
-        result = {
-            "physical_state": "",
-            "color": "",
-            "density": "",
-            "melting_point": "",
-            "boiling_point": "",
-            "flash_point": "",
-            "solubility": "",
-            "vapor_pressure": "",
-        }
+        result = dict.fromkeys(_HAZARD_FIELDS, "")
 
         # Get full JSON data
-        full_json = self._get_full_json_data(cid)
+        if full_json is None:
+            full_json = self._get_full_json_data(cid)
 
         if not full_json or "Record" not in full_json:
             return result
 
         try:
-            # Comprehensive property search
-            sections = full_json.get("Record", {}).get("Section", [])
-
-            # Recursively search through all sections
-            def search_sections(sections):
-                properties = {}
-                for section in sections:
-                    # Log the section for debugging
-                    logger.info(
-                        f"Examining section: {section.get('TOCHeading', 'Unknown')}"
-                    )
-
-                    # Check for specific headings
-                    headings_map = {
-                        "Physical Description": "physical_state",
-                        "Color/Form": "color",
-                        "Density": "density",
-                        "Melting Point": "melting_point",
-                        "Boiling Point": "boiling_point",
-                        "Flash Point": "flash_point",
-                        "Solubility": "solubility",
-                        "Vapor Pressure": "vapor_pressure",
-                    }
-
-                    # Check current section
-                    section_heading = section.get("TOCHeading", "")
-                    if section_heading in headings_map:
-                        if "Information" in section:
-                            for info in section["Information"]:
-                                if (
-                                    "Value" in info
-                                    and "StringWithMarkup" in info["Value"]
-                                ):
-                                    for markup in info["Value"]["StringWithMarkup"]:
-                                        if "String" in markup:
-                                            prop_name = headings_map[section_heading]
-                                            properties[prop_name] = markup["String"]
-
-                    # Recursively search subsections
-                    if "Section" in section:
-                        sub_properties = search_sections(section["Section"])
-                        properties.update(sub_properties)
-
-                return properties
-
-            # Perform the search
-            extracted_properties = search_sections(sections)
+            # Walk every section once, depth first in document order. When a
+            # property appears several times, the last string found wins
+            properties = {}
+            stack = list(reversed(full_json["Record"].get("Section", [])))
+            while stack:
+                section = stack.pop()
+                field = _HAZARD_HEADINGS.get(section.get("TOCHeading"))
+                if field is not None:
+                    for string in _markup_strings(section.get("Information", ())):
+                        properties[field] = string
+                stack.extend(reversed(section.get("Section", ())))
 
             # Update the result dictionary
-            for key, value in extracted_properties.items():
+            for key, value in properties.items():
                 if value:
                     result[key] = value
 
@@ -13,6 +13,12 @@ import time
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
+try:
+    # Optional: orjson reads and writes cache files considerably faster
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -66,8 +72,7 @@ class CacheManager:
             return None
 
         try:
-            with open(cache_file, "r") as f:
-                cached_data = json.load(f)
+            cached_data = self._read(cache_file)
 
             # Check if the cache has expired
             if time.time() - cached_data.get("timestamp", 0) > self.max_age:
@@ -96,8 +101,12 @@ class CacheManager:
         try:
             cached_data = {"timestamp": time.time(), "data": data}
 
-            with open(cache_file, "w") as f:
-                json.dump(cached_data, f)
+            if orjson is not None:
+                payload = orjson.dumps(cached_data, option=orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(cached_data).encode()
+            with open(cache_file, "wb") as f:
+                f.write(payload)
 
             logger.debug(f"Cached data for key: {key}")
             return True
@@ -144,8 +153,7 @@ class CacheManager:
         try:
             for cache_file in self.cache_dir.glob("*.json"):
                 try:
-                    with open(cache_file, "r") as f:
-                        cached_data = json.load(f)
+                    cached_data = self._read(cache_file)
 
                     # Check if the cache has expired
                     if time.time() - cached_data.get("timestamp", 0) > self.max_age:
@@ -162,6 +170,23 @@ class CacheManager:
             logger.warning(f"Error clearing expired cache: {str(e)}")
             return cleared_count
 
+    @staticmethod
+    def _read(cache_file: Path) -> Dict[str, Any]:
+        """
+        Read and decode a cache file.
+
+        Args:
+            cache_file: Path to the cache file
+
+        Returns:
+            The cache entry, with its timestamp and data
+        """
+        with open(cache_file, "rb") as f:
+            content = f.read()
+        if orjson is not None:
+            return orjson.loads(content)
+        return json.loads(content)
+
     def _get_cache_file(self, key: str) -> Path:
         """
         Get the cache file path for a key.
@@ -6,6 +6,11 @@ import re
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
+# CAS registry numbers, anywhere in a text and as a whole string. Compiled
+# once, since synonym lists with hundreds of entries are scanned for them
+_CAS_SEARCH_RE = re.compile(r"(\d{1,7})-(\d{2})-(\d{1})")
+_CAS_RE = re.compile(r"^\d{1,7}-\d{2}-\d{1}$")
+
 
 def parse_cas_number(text: str) -> Optional[str]:
     """
@@ -21,8 +26,7 @@ def parse_cas_number(text: str) -> Optional[str]:
         return None
 
     # Try to extract a CAS pattern from the text
-    cas_pattern = r"(\d{1,7})-(\d{2})-(\d{1})"
-    match = re.search(cas_pattern, text)
+    match = _CAS_SEARCH_RE.search(text)
 
     if not match:
         return None
@@ -45,7 +49,7 @@ def is_valid_cas(cas_number: str) -> bool:
     Returns:
         True if the CAS number is valid, False otherwise
     """
-    if not cas_number or not re.match(r"^\d{1,7}-\d{2}-\d{1}$", cas_number):
+    if not cas_number or not _CAS_RE.match(cas_number):
         return False
 
     # Split the CAS number
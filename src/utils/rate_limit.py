@@ -0,0 +1,56 @@
+"""
+Rate limiting for API requests.
+
+This module provides a token bucket that keeps requests under an API's
+rate limit while letting unused capacity build up for short bursts.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket rate limiter.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``rate`` tokens per ``per`` seconds. Each request takes one token, and
+    waits only when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0, capacity: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            rate: Number of requests allowed per period
+            per: Length of the period in seconds (default: 1 second)
+            capacity: Largest burst of requests allowed after a quiet spell
+                (default: rate)
+        """
+        self.rate = rate
+        self.per = per
+        self.capacity = rate if capacity is None else capacity
+        self.tokens = self.capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            # Refill for the time elapsed since the last call
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last) * self.rate / self.per
+            )
+            self.last = now
+
+            # Take a token, going into debt if the bucket is empty so that
+            # waiting callers queue up in order
+            self.tokens -= 1
+            wait = -self.tokens * self.per / self.rate
+
+        # Sleep outside the lock so other threads can take their turn
+        if wait > 0:
+            time.sleep(wait)
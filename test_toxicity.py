@@ -1,30 +1,5 @@
-import re
 from src.database.db_manager import DatabaseManager
-
-def extract_ld50_values(text):
-    """Extract LD50 values from text."""
-    if not text:
-        return None
-        
-    ld50_values = []
-    
-    # Different LD50 formats to match
-    patterns = [
-        r"LD50:\s*([\d\.]+)\s*(mg/kg|g/kg).*?\(([^)]+)\)",  # Format: LD50: 5628 mg/kg (Oral, rat)
-        r"LD50\s+(\w+)\s+(\w+)\s+([\d\.]+)\s+(g/[lL]|mg/kg)",  # Format: LD50 Mouse iv 2.0 g/L
-        r"LD50.*?(\d+[\d\.]*).*?(mg/kg|g/kg|mg/L|g/L).*?\(([^)]+)\)"  # More general pattern
-    ]
-    
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
-            value = match.group(0).strip()
-            if value and value not in ld50_values:
-                ld50_values.append(value)
-    
-    if not ld50_values:
-        return None
-        
-    return "; ".join(ld50_values)
+from src.main import extract_ld50_values
 
 # Connect to the database
 db_manager = DatabaseManager()
@@ -0,0 +1,254 @@
+"""
+Tests for the DatabaseManager class.
+"""
+
+import csv
+
+import pytest
+
+from src.database.db_manager import DatabaseManager, get_db
+
+
+class TestDatabaseManager:
+    """Tests for the DatabaseManager class."""
+
+    @pytest.fixture
+    def db_manager(self, tmp_path):
+        """Create a database manager backed by a temporary SQLite file."""
+        manager = DatabaseManager(str(tmp_path / "test.db"))
+        manager.add_chemical(
+            {"name": "ethanol", "cas_number": "64-17-5", "formula": "C2H6O"}
+        )
+        manager.add_chemical(
+            {"name": "Methanol", "cas_number": "67-56-1", "formula": "CH4O"}
+        )
+        return manager
+
+    @pytest.mark.parametrize(
+        "query,expected",
+        [
+            ("eth", {"ethanol", "Methanol"}),
+            ("METHANOL", {"Methanol"}),
+            ("64-17", {"ethanol"}),
+            ("c2h", {"ethanol"}),
+            ("O", {"ethanol", "Methanol"}),
+            ("benzene", set()),
+        ],
+    )
+    def test_search_chemicals(self, db_manager, query, expected):
+        """Test substring search over name, CAS number and formula."""
+        results = db_manager.search_chemicals(query)
+        assert {c["name"] for c in results} == expected
+
+    def test_search_chemicals_without_fulltext(self, db_manager):
+        """Test that the LIKE fallback returns the same matches."""
+        db_manager.fts_enabled = False
+        results = db_manager.search_chemicals("anol")
+        assert {c["name"] for c in results} == {"ethanol", "Methanol"}
+
+    @pytest.mark.parametrize("fts_enabled", [True, False])
+    def test_search_chemicals_limit(self, db_manager, fts_enabled):
+        """Test that a limit caps the number of matches returned."""
+        db_manager.fts_enabled = fts_enabled
+        results = db_manager.search_chemicals("anol", limit=1)
+        assert len(results) == 1
+        assert results[0]["name"] in {"ethanol", "Methanol"}
+
+    def test_search_index_follows_updates(self, db_manager):
+        """Test that the full-text index tracks updated rows."""
+        db_manager.add_chemical(
+            {"name": "ethyl alcohol", "cas_number": "64-17-5", "formula": "C2H6O"}
+        )
+        assert {c["name"] for c in db_manager.search_chemicals("alcohol")} == {
+            "ethyl alcohol"
+        }
+        assert {c["name"] for c in db_manager.search_chemicals("ethanol")} == {
+            "Methanol"
+        }
+
+    def test_add_chemicals_bulk(self, db_manager):
+        """Test bulk insertion and update keyed on CAS number."""
+        ethanol_id = db_manager.get_chemical_by_cas("64-17-5")["id"]
+        stored = db_manager.add_chemicals_bulk(
+            [
+                {"name": "ethyl alcohol", "cas_number": "64-17-5"},
+                {"name": "acetone", "cas_number": "67-64-1", "hazard_codes": {}},
+                {"name": "propanone", "cas_number": "67-64-1"},
+                {"name": "water", "formula": "H2O"},
+            ],
+            chunk_size=2,
+        )
+        assert len(stored) == 3
+        assert ethanol_id in stored
+        assert db_manager.count_chemicals() == 4
+        ethanol = db_manager.get_chemical_by_cas("64-17-5")
+        assert ethanol["name"] == "ethyl alcohol"
+        assert ethanol["id"] == ethanol_id
+        assert ethanol["formula"] == "C2H6O"
+        assert db_manager.get_chemical_by_cas("67-64-1")["name"] == "propanone"
+
+    def test_add_chemicals_bulk_skips_existing(self, db_manager):
+        """Test that on_conflict="skip" leaves stored chemicals untouched."""
+        stored = db_manager.add_chemicals_bulk(
+            [
+                {"name": "ethyl alcohol", "cas_number": "64-17-5"},
+                {"name": "acetone", "cas_number": "67-64-1"},
+            ],
+            on_conflict="skip",
+        )
+        assert len(stored) == 1
+        assert db_manager.get_chemical_by_cas("64-17-5")["name"] == "ethanol"
+        assert db_manager.get_chemical_by_cas("67-64-1")["id"] == stored[0]
+
+        # Skipping every chemical isn't a failure
+        assert (
+            db_manager.add_chemicals_bulk(
+                [{"name": "acetone", "cas_number": "67-64-1"}], on_conflict="skip"
+            )
+            == []
+        )
+
+    def test_add_chemicals_bulk_failure(self, db_manager):
+        """Test that a failed batch returns None and stores nothing."""
+        ethanol_id = db_manager.get_chemical_by_cas("64-17-5")["id"]
+        stored = db_manager.add_chemicals_bulk(
+            [{"name": "water", "formula": "H2O"}, {"id": ethanol_id, "name": "x"}]
+        )
+        assert stored is None
+        assert db_manager.count_chemicals() == 2
+
+    def test_add_chemicals_bulk_matches_name_and_formula(self, tmp_path):
+        """Test that chemicals without a CAS number aren't stored twice."""
+        manager = DatabaseManager(str(tmp_path / "nocas.db"))
+        first = manager.add_chemicals_bulk([{"name": "water", "formula": "H2O"}])
+        assert manager.count_chemicals() == 1
+
+        stored = manager.add_chemicals_bulk(
+            [{"name": "water", "formula": "H2O", "ld50": "90 g/kg"}]
+        )
+        assert stored == first
+        assert manager.count_chemicals() == 1
+        assert manager.search_chemicals("water")[0]["ld50"] == "90 g/kg"
+
+        assert (
+            manager.add_chemicals_bulk(
+                [{"name": "water", "formula": "H2O"}], on_conflict="skip"
+            )
+            == []
+        )
+        assert manager.count_chemicals() == 1
+
+    def test_add_chemicals_bulk_attaches_cas_number(self, db_manager):
+        """Test that bulk adds attach a CAS number to a name and formula match."""
+        chem_id = db_manager.add_chemical({"name": "acetone", "formula": "C3H6O"})
+        stored = db_manager.add_chemicals_bulk(
+            [
+                {"name": "acetone", "formula": "C3H6O", "cas_number": "67-64-1"},
+                {"name": "ethanol", "formula": "C2H6O", "cas_number": "64-17-5"},
+            ]
+        )
+        assert chem_id in stored
+        assert db_manager.get_chemical_by_cas("67-64-1")["id"] == chem_id
+        assert db_manager.count_chemicals() == 3
+
+    def test_add_chemical_upserts_on_cas_number(self, db_manager):
+        """Test that re-adding a CAS number updates the existing row."""
+        original = db_manager.get_chemical_by_cas("64-17-5")
+        chem_id = db_manager.add_chemical(
+            {"cas_number": "64-17-5", "name": "ethanol", "ld50": "7060 mg/kg"}
+        )
+        assert chem_id == original["id"]
+
+        updated = db_manager.get_chemical_by_cas("64-17-5")
+        assert updated["ld50"] == "7060 mg/kg"
+        assert updated["formula"] == "C2H6O"
+        assert db_manager.count_chemicals() == 2
+
+    def test_add_chemical_attaches_cas_number(self, db_manager):
+        """Test that a CAS number is added to a row matched by name and formula."""
+        chem_id = db_manager.add_chemical({"name": "acetone", "formula": "C3H6O"})
+        assert (
+            db_manager.add_chemical(
+                {"name": "acetone", "formula": "C3H6O", "cas_number": "67-64-1"}
+            )
+            == chem_id
+        )
+        assert db_manager.get_chemical_by_cas("67-64-1")["id"] == chem_id
+        assert db_manager.count_chemicals() == 3
+
+    def test_export_to_csv(self, db_manager, tmp_path):
+        """Test that every stored chemical is written to the CSV export."""
+        output_path = db_manager.export_to_csv(str(tmp_path / "export.csv"))
+
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+        assert [r["name"] for r in rows] == ["ethanol", "Methanol"]
+        assert rows[0]["cas_number"] == "64-17-5"
+
+    def test_get_chemical_by_cas_sees_writes(self, db_manager):
+        """Test that cached CAS lookups are refreshed after a write."""
+        chemical = db_manager.get_chemical_by_cas("64-17-5")
+        assert chemical["ld50"] is None
+
+        # Modifying the returned dictionary must not affect the cache
+        chemical["ld50"] = "1 mg/kg"
+        assert db_manager.get_chemical_by_cas("64-17-5")["ld50"] is None
+
+        db_manager.add_chemical(
+            {"name": "ethanol", "cas_number": "64-17-5", "ld50": "7060 mg/kg"}
+        )
+        assert db_manager.get_chemical_by_cas("64-17-5")["ld50"] == "7060 mg/kg"
+        assert db_manager.get_chemical_by_cas("0-00-0") is None
+
+    def test_search_chemicals_bulk(self, db_manager):
+        """Test finding stored chemicals by exact name or CAS number."""
+        found = db_manager.search_chemicals_bulk(
+            ["Ethanol", "67-56-1", "eth", "benzene"]
+        )
+        assert found == {"ethanol", "67-56-1"}
+        assert db_manager.search_chemicals_bulk([]) == set()
+
+    def test_delete_by_identifier(self, db_manager):
+        """Test deleting a chemical by exact name or CAS number."""
+        deleted = db_manager.delete_by_identifier("methanol")
+        assert [c["cas_number"] for c in deleted] == ["67-56-1"]
+        assert db_manager.get_chemical_by_cas("67-56-1") is None
+        assert db_manager.search_chemicals("methanol") == []
+
+        assert db_manager.delete_by_identifier("eth") == []
+        assert db_manager.count_chemicals() == 1
+
+    def test_delete_by_identifier_keeps_ambiguous_matches(self, db_manager):
+        """Test that nothing is deleted when several chemicals match."""
+        db_manager.add_chemical({"name": "64-17-5", "cas_number": "0-00-0"})
+        assert len(db_manager.delete_by_identifier("64-17-5")) == 2
+        assert db_manager.count_chemicals() == 3
+
+    def test_delete_chemical(self, db_manager):
+        """Test deleting a chemical by ID."""
+        chem_id = db_manager.get_chemical_by_cas("64-17-5")["id"]
+        assert db_manager.delete_chemical(chem_id)
+        assert not db_manager.delete_chemical(chem_id)
+        assert db_manager.get_chemical_by_cas("64-17-5") is None
+
+    def test_schema_created_for_each_database(self, tmp_path):
+        """Test that a database recreated at a known path gets its schema."""
+        for _ in range(2):
+            manager = DatabaseManager(":memory:")
+            assert manager.add_chemical({"name": "water", "formula": "H2O"})
+            assert manager.count_chemicals() == 1
+
+        db_path = tmp_path / "recreated.db"
+        DatabaseManager(str(db_path)).engine.dispose()
+        db_path.unlink()
+        manager = DatabaseManager(str(db_path))
+        assert manager.add_chemical({"name": "water", "formula": "H2O"})
+        assert manager.count_chemicals() == 1
+
+    def test_get_db_normalises_path(self, tmp_path, monkeypatch):
+        """Test that one manager is shared however the path is written."""
+        monkeypatch.chdir(tmp_path)
+        manager = get_db("shared.db")
+        assert get_db(str(tmp_path / "shared.db")) is manager
+        assert get_db("./shared.db") is manager
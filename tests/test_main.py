@@ -0,0 +1,89 @@
+"""
+Tests for the command-line interface helpers.
+"""
+
+import pytest
+
+from src.database.db_manager import DatabaseManager
+from src.main import (
+    _store_one_by_one,
+    _unique_lines,
+    extract_lc50_values,
+    extract_ld50_values,
+    extract_toxicity,
+    process_chemical_data,
+)
+
+NOTES = (
+    "LD50: 5628 mg/kg (Oral, rat) ; LD50 Mouse iv 2.0 g/L; "
+    "LC50 Mouse inhalation 39 g/cu m/4 hr"
+)
+
+
+class TestMain:
+    """Tests for the command-line interface helpers."""
+
+    def test_extract_ld50_values(self):
+        """Test extracting LD50 values from toxicity notes."""
+        assert extract_ld50_values(NOTES) == (
+            "LD50: 5628 mg/kg (Oral, rat); LD50 Mouse iv 2.0 g/L"
+        )
+
+    def test_extract_lc50_values(self):
+        """Test extracting LC50 values from toxicity notes."""
+        assert extract_lc50_values(NOTES) == "LC50 Mouse inhalation 39 g/cu m"
+
+    @pytest.mark.parametrize("text", [None, "", "No toxicity data"])
+    def test_extract_without_values(self, text):
+        """Test that text without values gives None."""
+        assert extract_ld50_values(text) is None
+        assert extract_lc50_values(text) is None
+
+    def test_extract_ignores_case(self):
+        """Test that markers and units are matched regardless of case."""
+        assert extract_ld50_values("ld50 rat oral 320 MG/KG") == (
+            "ld50 rat oral 320 MG/KG"
+        )
+        assert extract_lc50_values("Lc50 rat 12 PPM") == "Lc50 rat 12 PPM"
+
+    def test_extract_toxicity(self):
+        """Test extracting both values from toxicity notes at once."""
+        assert extract_toxicity(NOTES) == (
+            extract_ld50_values(NOTES),
+            extract_lc50_values(NOTES),
+        )
+        assert extract_toxicity(None) == (None, None)
+
+    def test_process_chemical_data_keeps_existing_values(self):
+        """Test that only missing toxicity values are filled from the notes."""
+        data = process_chemical_data(
+            {"ld50": "320 mg/kg", "lc50": None, "acute_toxicity_notes": NOTES}
+        )
+        assert data["ld50"] == "320 mg/kg"
+        assert data["lc50"] == "LC50 Mouse inhalation 39 g/cu m"
+
+    def test_unique_lines(self):
+        """Test that import lines are stripped, deduplicated and read lazily."""
+        lines = iter(["ethanol\n", "\n", "  acetone \n", "ethanol\n", "water\n"])
+        unique = _unique_lines(lines)
+        assert next(unique) == "ethanol"
+        # Only the lines needed so far have been read
+        assert next(lines) == "\n"
+
+        assert list(unique) == ["acetone", "water"]
+
+    def test_store_one_by_one(self, tmp_path):
+        """Test that a failing row doesn't keep the rest of a batch from storing."""
+        db_manager = DatabaseManager(str(tmp_path / "test.db"))
+        chem_id = db_manager.add_chemical({"name": "water", "formula": "H2O"})
+        _store_one_by_one(
+            db_manager,
+            [
+                {"name": "ethanol", "cas_number": "64-17-5"},
+                {"id": chem_id, "name": "duplicate id"},
+                {"name": "acetone", "cas_number": "67-64-1"},
+            ],
+            skip_existing=False,
+        )
+        assert db_manager.count_chemicals() == 3
+        assert db_manager.get_chemical_by_cas("67-64-1")["name"] == "acetone"
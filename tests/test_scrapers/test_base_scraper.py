@@ -44,6 +44,17 @@ class TestBaseScraper:
         # Test with empty string
         assert scraper.clean_text("") == ""
 
+    def test_session_pools_and_retries(self):
+        """Test that the session keeps connections alive and retries failures."""
+        scraper = MockScraper("https://example.com")
+        adapter = scraper.session.get_adapter("https://example.com/page")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 5
+        # Error responses are left to the scrapers' own retry handling
+        assert not adapter.max_retries.status_forcelist
+        assert not adapter.max_retries.is_retry("GET", 429, has_retry_after=True)
+        assert "gzip" in scraper.session.headers["Accept-Encoding"]
+
     def test_context_manager(self):
         """Test using the scraper as a context manager."""
         with MockScraper("https://example.com") as scraper:
@@ -72,6 +83,7 @@ class TestBaseScraper:
         class MockResponse:
             def __init__(self, text, status_code=200):
                 self.text = text
+                self.content = text.encode()
                 self.status_code = status_code
 
             def raise_for_status(self):
@@ -84,14 +96,21 @@ class TestBaseScraper:
             def __init__(self):
                 self.headers = {}
                 self.get_called = False
+                self.get_count = 0
                 self.closed = False
 
             def get(self, url):
                 self.get_called = True
+                self.get_count += 1
                 if "error" in url:
                     return MockResponse("", 404)
+                if url.endswith("/JSON"):
+                    return MockResponse('{"IdentifierList": {"CID": [180]}}')
                 return MockResponse("<html><body><p>Test</p></body></html>")
 
+            def mount(self, prefix, adapter):
+                pass
+
             def close(self):
                 self.closed = True
 
@@ -117,6 +136,52 @@ class TestBaseScraper:
         with pytest.raises(requests.exceptions.HTTPError):
             scraper.get_page("https://example.com/error")
 
+    def test_get_page_cached(self, mock_session):
+        """Test that a caching scraper fetches each URL only once."""
+        scraper = MockScraper("https://example.com", cache=True)
+        first = scraper.get_page("https://example.com")
+        second = scraper.get_page("https://example.com")
+        assert mock_session.get_count == 1
+        assert first is not second
+        assert str(first) == str(second)
+
+        # Without caching every call makes a request
+        scraper = MockScraper("https://example.com")
+        scraper.get_page("https://example.com")
+        scraper.get_page("https://example.com")
+        assert mock_session.get_count == 3
+
+    def test_get_pages(self, mock_session):
+        """Test fetching several pages concurrently."""
+        scraper = MockScraper("https://example.com")
+
+        pages = scraper.get_pages(["https://example.com/a", "https://example.com/b"])
+        assert len(pages) == 2
+        assert all(page.p.text == "Test" for page in pages)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            scraper.get_pages(["https://example.com/a", "https://example.com/error"])
+
+    def test_get_tree(self, mock_session):
+        """Test fetching a page as an lxml tree."""
+        scraper = MockScraper("https://example.com")
+
+        tree = scraper.get_tree("https://example.com")
+        assert tree.xpath("//p/text()") == ["Test"]
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            scraper.get_tree("https://example.com/error")
+
+    def test_get_json(self, mock_session):
+        """Test fetching and decoding a JSON document."""
+        scraper = MockScraper("https://example.com")
+
+        data = scraper.get_json("https://example.com/compound/JSON")
+        assert data == {"IdentifierList": {"CID": [180]}}
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            scraper.get_json("https://example.com/error/JSON")
+
     def test_close(self, mock_session):
         """Test the close method."""
         scraper = MockScraper("https://example.com")
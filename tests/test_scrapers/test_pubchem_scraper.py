@@ -7,6 +7,7 @@ import pytest
 import requests
 
 from src.scrapers.pubchem_scraper import PubChemScraper
+from src.utils.cache_manager import CacheManager
 
 
 class TestPubChemScraper:
@@ -17,9 +18,10 @@ class TestPubChemScraper:
         """Mock the requests.Session object for PubChem responses."""
 
         class MockResponse:
-            def __init__(self, json_data, status_code=200):
+            def __init__(self, json_data, status_code=200, text=None):
                 self.json_data = json_data
-                self.text = json.dumps(json_data)
+                self.text = json.dumps(json_data) if text is None else text
+                self.content = self.text.encode()
                 self.status_code = status_code
 
             def raise_for_status(self):
@@ -34,6 +36,8 @@ class TestPubChemScraper:
         class MockSession:
             def __init__(self):
                 self.headers = {}
+                self.get_count = 0
+                self.urls = []
                 self.responses = {
                     # Search response
                     "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/acetone/cids/JSON": MockResponse(
@@ -55,17 +59,17 @@ class TestPubChemScraper:
                         }
                     ),
                     # Synonyms response
+                    "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/180/synonyms/TXT": MockResponse(
+                        None,
+                        text="acetone\npropanone\n67-64-1\n",  # CAS number
+                    ),
                     "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/180/synonyms/JSON": MockResponse(
                         {
                             "InformationList": {
                                 "Information": [
                                     {
                                         "CID": 180,
-                                        "Synonym": [
-                                            "acetone",
-                                            "propanone",
-                                            "67-64-1",  # CAS number
-                                        ],
+                                        "Synonym": ["acetone", "propanone", "67-64-1"],
                                     }
                                 ]
                             }
@@ -233,6 +237,9 @@ class TestPubChemScraper:
                 }
 
             def get(self, url):
+                self.get_count += 1
+                self.urls.append(url)
+
                 # For property URLs with multiple properties, match the base URL
                 for base_url, response in self.responses.items():
                     if url.startswith(base_url.split("property/")[0] + "property/"):
@@ -243,6 +250,9 @@ class TestPubChemScraper:
                     url, MockResponse({"error": "Not found"}, 404)
                 )
 
+            def mount(self, prefix, adapter):
+                pass
+
             def close(self):
                 pass
 
@@ -313,3 +323,122 @@ class TestPubChemScraper:
             section_types=["Non-existent Type"],
         )
         assert non_existent is None
+
+    def test_refresh_cache_skips_cached_responses(self, mock_session, tmp_path):
+        """Test that refresh_cache fetches again instead of reading the cache."""
+        url = (
+            "https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/name/acetone/cids/JSON"
+        )
+
+        scraper = PubChemScraper()
+        scraper.cache = CacheManager(cache_dir=tmp_path)
+        assert scraper._api_request(url) == {"IdentifierList": {"CID": [180]}}
+        assert scraper._api_request(url) == {"IdentifierList": {"CID": [180]}}
+        assert mock_session.get_count == 1
+
+        refreshing = PubChemScraper(refresh_cache=True)
+        refreshing.cache = CacheManager(cache_dir=tmp_path)
+        assert refreshing._api_request(url) == {"IdentifierList": {"CID": [180]}}
+        assert mock_session.get_count == 2
+
+    def test_search_chemicals_bulk(self, mock_session, tmp_path):
+        """Test searching several chemicals with batched property requests."""
+        scraper = PubChemScraper()
+        scraper.cache = CacheManager(cache_dir=tmp_path)
+
+        results = scraper.search_chemicals_bulk(["acetone", "unobtainium"])
+        assert results["unobtainium"] == []
+        assert results["acetone"] == [
+            {
+                "cid": 180,
+                "name": "propan-2-one",
+                "formula": "C3H6O",
+                "molecular_weight": 58.08,
+            }
+        ]
+        # One search per name plus a single properties and synonyms request
+        assert mock_session.get_count == 4
+
+        # The CAS number found in bulk isn't requested again
+        assert scraper._get_cas_number(180) == "67-64-1"
+        assert mock_session.get_count == 4
+        assert scraper._pending_cas_numbers == {}
+
+    def test_search_results_properties_reused(self, mock_session):
+        """Test that properties fetched for search results aren't requested again."""
+        scraper = PubChemScraper(use_cache=False)
+
+        scraper.search_chemicals_bulk(["acetone"])
+        assert mock_session.get_count == 3
+
+        assert scraper._get_properties(180)["IUPACName"] == "propan-2-one"
+        assert mock_session.get_count == 3
+        assert scraper._pending_properties == {}
+
+    def test_search_chemical_keeps_no_properties(self, mock_session):
+        """Test that a single search doesn't hold on to its results' properties."""
+        scraper = PubChemScraper(use_cache=False)
+        assert scraper.search_chemical("acetone")
+        assert scraper._pending_properties == {}
+
+    def test_extract_chemical_data_fetches_each_record_once(self, mock_session):
+        """Test that extraction requests each PubChem record only once."""
+        scraper = PubChemScraper(use_cache=False)
+        data = scraper.extract_chemical_data({"cid": 180})
+        assert data["cas_number"] == "67-64-1"
+        # Properties, synonyms, GHS classification and the full record
+        assert mock_session.get_count == 4
+
+    def test_extract_chemical_data_ghs_fallback(self, mock_session):
+        """Test that the GHS fallback reuses the full record already fetched."""
+        del mock_session.responses[
+            "https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/compound/180/JSON?heading=GHS+Classification"
+        ]
+        scraper = PubChemScraper(use_cache=False)
+        assert scraper.extract_chemical_data({"cid": 180})
+        assert (
+            mock_session.urls.count(
+                "https://pubchem.ncbi.nlm.nih.gov/rest/pug_view/data/compound/180/JSON"
+            )
+            == 1
+        )
+
+    def test_full_json_data_cached_once(self, mock_session, tmp_path):
+        """Test that the full record is cached once and honours refresh_cache."""
+        scraper = PubChemScraper()
+        scraper.cache = CacheManager(cache_dir=tmp_path)
+        assert scraper._get_full_json_data("180")
+        assert scraper._get_full_json_data("180")
+        assert mock_session.get_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        refreshing = PubChemScraper(refresh_cache=True)
+        refreshing.cache = CacheManager(cache_dir=tmp_path)
+        assert refreshing._get_full_json_data("180")
+        assert mock_session.get_count == 2
+
+    def test_get_ghs_data(self, mock_session):
+        """Test reading each GHS classification subsection into its field."""
+        scraper = PubChemScraper(use_cache=False)
+        assert scraper._get_ghs_data("180") == {
+            "hazard_statements": "H225: Highly flammable liquid and vapour",
+            "precautionary_statements": "",
+            "pictograms": "Flame",
+            "signal_word": "Danger",
+        }
+
+    def test_extract_chemical_data_invalid_number(self, mock_session):
+        """Test that a malformed numeric property doesn't drop the record."""
+        scraper = PubChemScraper(use_cache=False)
+        scraper._pending_properties["180"] = {
+            "CID": 180,
+            "IUPACName": "propan-2-one",
+            "MolecularWeight": "58.08",
+            "XLogP": "n/a",
+            "Charge": 0,
+        }
+        data = scraper.extract_chemical_data({"cid": 180})
+        assert data["name"] == "propan-2-one"
+        assert data["molecular_weight"] == 58.08
+        assert data["xlogp"] is None
+        assert data["charge"] == 0
@@ -0,0 +1,83 @@
+"""
+Tests for the RateLimiter class.
+"""
+
+import pytest
+
+from src.scrapers.pubchem_scraper import _PUBCHEM_LIMITER
+from src.utils import rate_limit
+from src.utils.rate_limit import RateLimiter
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter class."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Replace the clock and sleep with a fake that records sleeps."""
+
+        class FakeClock:
+            def __init__(self):
+                self.now = 100.0
+                self.sleeps = []
+
+            def monotonic(self):
+                return self.now
+
+            def sleep(self, seconds):
+                self.sleeps.append(seconds)
+                self.now += seconds
+
+        fake = FakeClock()
+        monkeypatch.setattr(rate_limit, "time", fake)
+        return fake
+
+    def test_burst_up_to_rate(self, clock):
+        """Test that a full bucket allows a burst without waiting."""
+        limiter = RateLimiter(rate=5)
+        for _ in range(5):
+            limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [pytest.approx(0.2)]
+
+    def test_refills_over_time(self, clock):
+        """Test that tokens come back as time passes."""
+        limiter = RateLimiter(rate=2, per=1.0)
+        limiter.acquire()
+        limiter.acquire()
+
+        clock.now += 0.5
+        limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [pytest.approx(0.5)]
+
+    def test_capacity_limits_burst(self, clock):
+        """Test that unused time only builds up to the bucket's capacity."""
+        limiter = RateLimiter(rate=5, capacity=2)
+        clock.now += 10
+        limiter.acquire()
+        limiter.acquire()
+        assert clock.sleeps == []
+
+        limiter.acquire()
+        assert clock.sleeps == [pytest.approx(0.2)]
+
+    def test_pubchem_limiter_stays_under_policy(self, clock):
+        """Test that PubChem gets no more than 5 requests in any second."""
+        limiter = RateLimiter(
+            rate=_PUBCHEM_LIMITER.rate,
+            per=_PUBCHEM_LIMITER.per,
+            capacity=_PUBCHEM_LIMITER.capacity,
+        )
+        clock.now += 60
+        sent = []
+        for _ in range(20):
+            limiter.acquire()
+            sent.append(clock.now)
+
+        for first, sixth in zip(sent, sent[5:]):
+            assert round(sixth - first, 9) >= 1.0
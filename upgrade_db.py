@@ -1,55 +1,7 @@
 # update_toxicity.py
-import re
 from src.database.db_manager import DatabaseManager
 from src.scrapers.pubchem_scraper import PubChemScraper
 
-def extract_ld50_values(text):
-    """Extract LD50 values from text."""
-    if not text:
-        return None
-        
-    ld50_values = []
-    
-    patterns = [
-        r"LD50:\s*([\d\.]+)\s*(mg/kg|g/kg).*?\(([^)]+)\)", 
-        r"LD50\s+(\w+)\s+(\w+)\s+([\d\.]+)\s+(g/[lL]|mg/kg)",
-        r"LD50.*?(\d+[\d\.]*).*?(mg/kg|g/kg|mg/L|g/L).*?\(([^)]+)\)"
-    ]
-    
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
-            value = match.group(0).strip()
-            if value and value not in ld50_values:
-                ld50_values.append(value)
-    
-    if not ld50_values:
-        return None
-        
-    return "; ".join(ld50_values)
-
-def extract_lc50_values(text):
-    """Extract LC50 values from text."""
-    if not text:
-        return None
-        
-    lc50_values = []
-    
-    patterns = [
-        r"LC50\s+(\w+)\s+(\w+)\s+([\d\.]+)\s+(g/cu m|ppm).*?(\d+)\s*hr",
-        r"LC50.*?(\d+[\d\.]*).*?(ppm|mg/[lL]|g/[lL]|mg/m3|g/m3)"
-    ]
-    
-    for pattern in patterns:
-        for match in re.finditer(pattern, text):
-            value = match.group(0).strip()
-            if value and value not in lc50_values:
-                lc50_values.append(value)
-    
-    if not lc50_values:
-        return None
-        
-    return "; ".join(lc50_values)
-
 def update_chemicals():
     """Update all chemicals with toxicity data."""
     db_manager = DatabaseManager()